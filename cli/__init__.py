@@ -19,11 +19,8 @@ Features:
 - Programmatic usage support
 """
 
-from .args import parse_args
-from .audit import handle_audit_command
-from .commands import handle_config_command, handle_status_command
-from .runner import load_config, resolve_mode, run_cli, setup_mode_and_config
-from .utils import display_banner, get_mode_display_name, interactive_mode_selection
+import importlib
+from typing import Any
 
 __version__ = "1.1.0"
 __author__ = "PepeluGPT Team"
@@ -49,7 +46,37 @@ __all__ = [
     "__author__",
 ]
 
-from typing import Any
+# Public names are resolved lazily (PEP 562) so that importing a single
+# submodule such as ``cli.args`` does not pull in the runner, audit and
+# orchestrator dependency trees.
+_LAZY_EXPORTS: dict[str, str] = {
+    "parse_args": ".args",
+    "run_cli": ".runner",
+    "load_config": ".runner",
+    "resolve_mode": ".runner",
+    "setup_mode_and_config": ".runner",
+    "display_banner": ".utils",
+    "interactive_mode_selection": ".utils",
+    "get_mode_display_name": ".utils",
+    "handle_status_command": ".commands",
+    "handle_config_command": ".commands",
+    "handle_audit_command": ".audit",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported CLI helpers on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 # CLI Information
 CLI_INFO: dict[str, Any] = {
@@ -4,10 +4,20 @@ Argument parsing for PepeluGPT CLI with subcommands.
 """
 
 import argparse
+import sys
+from functools import lru_cache
+from typing import Optional, Sequence
 
 
-def parse_args():
-    """Parse command line arguments for PepeluGPT CLI with subcommands."""
+@lru_cache(maxsize=None)
+def _build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Build the PepeluGPT argument parser.
+
+    When ``command`` is given only that subcommand's subtree is constructed;
+    otherwise every subcommand is added (needed for top-level help and error
+    reporting). Parsers are cached per command and reused across calls.
+    """
     parser = argparse.ArgumentParser(
         description="PepeluGPT - Your Cybersecurity AI Assistant",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -29,12 +39,24 @@ Examples:
     )
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
     parser.add_argument("--version", "-v", action="version", version="PepeluGPT 1.1.0")
+    # Chat options apply when no subcommand is given (chat is the default)
+    parser.set_defaults(preload_data=False, mode=None)
 
     # Create subparsers
     subparsers = parser.add_subparsers(
         dest="command", help="Available commands", metavar="COMMAND"
     )
+    if command is None:
+        for add_subparser in _SUBPARSER_BUILDERS.values():
+            add_subparser(subparsers)
+    else:
+        _SUBPARSER_BUILDERS[command](subparsers)
+
+    return parser
+
 
+def _add_chat_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the chat subcommand."""
     # Chat subcommand (default behavior)
     chat_parser = subparsers.add_parser(
         "chat",
@@ -52,6 +74,9 @@ Examples:
         help="Force specific mode: adaptive (exploratory) or classic (stable)",
     )
 
+
+def _add_status_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the status subcommand."""
     # Status subcommand
     status_parser = subparsers.add_parser(
         "status",
@@ -62,6 +87,9 @@ Examples:
         "--json", action="store_true", help="Output status in JSON format"
     )
 
+
+def _add_config_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the config subcommand and its actions."""
     # Config subcommand
     config_parser = subparsers.add_parser(
         "config",
@@ -93,6 +121,9 @@ Examples:
         description="Show all available configuration files",
     )
 
+
+def _add_audit_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the audit subcommand and its actions."""
     # Audit subcommand
     audit_parser = subparsers.add_parser(
         "audit",
@@ -102,6 +133,16 @@ Examples:
     audit_subparsers = audit_parser.add_subparsers(
         dest="audit_action", help="Audit actions", metavar="ACTION"
     )
+    # A bare "audit" runs the default audit, so it carries the run defaults
+    # and handlers can read every option directly
+    audit_parser.set_defaults(
+        type="all",
+        output="text",
+        severity=None,
+        save=None,
+        framework=None,
+        control=None,
+    )
 
     # Audit run command
     run_parser = audit_subparsers.add_parser(
@@ -151,6 +192,9 @@ Examples:
     trend_parser.add_argument("--days", type=int, default=30, help="Days to analyze")
     trend_parser.add_argument("--type", help="Filter by audit type")
 
+
+def _add_plugins_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the plugins subcommand and its actions."""
     # Plugins subcommand (Phase 5)
     plugins_parser = subparsers.add_parser(
         "plugins",
@@ -160,6 +204,7 @@ Examples:
     plugins_subparsers = plugins_parser.add_subparsers(
         dest="plugin_action", help="Plugin actions", metavar="ACTION"
     )
+    plugins_parser.set_defaults(category="custom")
 
     # Plugin list command
     plugins_subparsers.add_parser(
@@ -197,14 +242,43 @@ Examples:
         "validate", help="Validate plugins", description="Check all plugins for errors"
     )
 
+
+_SUBPARSER_BUILDERS = {
+    "chat": _add_chat_parser,
+    "status": _add_status_parser,
+    "config": _add_config_parser,
+    "audit": _add_audit_parser,
+    "plugins": _add_plugins_parser,
+}
+
+# Global options that consume the following token as their value
+_GLOBAL_VALUE_OPTIONS = frozenset({"--config", "-c"})
+
+
+def _select_command(argv: Sequence[str]) -> Optional[str]:
+    """Return the subcommand named in argv, or None if the full tree is needed."""
+    skip_value = False
+    for token in argv:
+        if skip_value:
+            skip_value = False
+        elif token in _GLOBAL_VALUE_OPTIONS:
+            skip_value = True
+        elif token in ("-h", "--help"):
+            return None
+        elif not token.startswith("-"):
+            # Unknown commands fall back to the full tree for proper errors
+            return token if token in _SUBPARSER_BUILDERS else None
+    # No subcommand given: chat is the default
+    return "chat"
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments for PepeluGPT CLI with subcommands."""
+    if argv is None:
+        argv = sys.argv[1:]
+    args = _build_parser(_select_command(argv)).parse_args(argv)
     # Set default command to 'chat' if no subcommand is provided
-    args = parser.parse_args()
     if args.command is None:
         args.command = "chat"
-        # Set default chat arguments when no subcommand specified
-        if not hasattr(args, "preload_data"):
-            args.preload_data = False
-        if not hasattr(args, "mode"):
-            args.mode = None
 
     return args
@@ -6,112 +6,272 @@ Provides security and compliance auditing capabilities.
 
 import argparse
 import datetime
+import io
+import itertools
 import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, List, cast
+from stat import S_IROTH
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, cast
 
+from cli.serialization import dumps_json, write_json
 
-class AuditResult:
+try:
+    from cli.runner import load_config
+except ImportError:
+    load_config = None  # type: ignore
+
+try:
+    from cli.audit_history import get_history_manager
+except ImportError:
+    get_history_manager = None  # type: ignore
+
+# Sensitive files and directories reported when present
+SENSITIVE_PATHS = ("config/", "logs/", "storage/", "cyber_vector_db/", ".env")
+
+# Extensions of credential files checked for loose permissions
+SENSITIVE_EXTENSIONS = (".key", ".pem")
+
+# Directories searched recursively for credential files (plus top-level files)
+CREDENTIAL_DIRS = ("config", "storage", "certs")
+
+# Config key fragments that suggest a hardcoded credential
+SECRET_KEY_WORDS = frozenset({"key", "token", "secret", "password"})
+SECRET_KEY_PATTERN = re.compile("|".join(sorted(SECRET_KEY_WORDS)), re.IGNORECASE)
+
+# Dependency files inspected by the dependency audit
+REQUIREMENTS_FILES = ("requirements.txt", "requirements_learning.txt")
+
+# Document collection inspected by the document audit
+DOCUMENTS_DIR = "cyber_documents"
+SENSITIVE_DOCUMENT_EXTENSIONS = (".pdf", ".docx", ".xlsx", ".pptx")
+
+# Findings cache for audits whose inputs are single files
+AUDIT_CACHE_PATH = Path(".pepelugpt") / "audit_cache.json"
+AUDIT_CACHE_VERSION = 1
+
+# Severity levels from lowest to highest, their ranks, and summary order
+SEVERITY_LEVELS = ("low", "medium", "high", "critical")
+SEVERITY_RANK = {level: rank for rank, level in enumerate(SEVERITY_LEVELS)}
+SUMMARY_ORDER = tuple(reversed(SEVERITY_LEVELS))
+
+# Report icon per finding severity
+SEVERITY_ICONS = {"critical": "🔴", "high": "🟠", "medium": "🟡", "low": "🔵"}
+
+# Directories skipped when walking the tree for credential files
+IGNORED_AUDIT_DIRS = frozenset(
+    {".git", ".venv", "__pycache__", "node_modules", "cyber_vector_db"}
+)
+
+
+def _iter_files(root: str) -> Iterator[os.DirEntry]:
+    """Yield file entries below root, skipping ignored directories."""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in IGNORED_AUDIT_DIRS:
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except OSError:
+            continue
+
+
+@lru_cache(maxsize=4)
+def _load_config_cached(config_path: str) -> Dict[str, Any]:
+    """Load a configuration once per audit run (cleared by handle_audit_command)."""
+    if load_config is None:
+        raise ImportError("configuration loader (cli.runner) is not available")
+    return load_config(config_path)
+
+
+class AuditResult(NamedTuple):
     """Represents a single audit finding."""
 
-    def __init__(
-        self,
-        category: str,
-        severity: str,
-        title: str,
-        description: str,
-        recommendation: str = "",
-        file_path: str = "",
-    ):
-        self.category = category
-        self.severity = severity
-        self.title = title
-        self.description = description
-        self.recommendation = recommendation
-        self.file_path = file_path
-        self.timestamp = datetime.datetime.now().isoformat()
+    category: str
+    severity: str
+    title: str
+    description: str
+    recommendation: str = ""
+    file_path: str = ""
+    timestamp: str = ""
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return {
-            "category": self.category,
-            "severity": self.severity,
-            "title": self.title,
-            "description": self.description,
-            "recommendation": self.recommendation,
-            "file_path": self.file_path,
-            "timestamp": self.timestamp,
-        }
+        return self._asdict()
+
+
+class AuditCache:
+    """
+    Persistent cache of audit findings keyed on the (mtime, size) of the
+    files an audit reads, so unchanged inputs are not re-audited.
+    """
+
+    def __init__(self, path: Path = AUDIT_CACHE_PATH):
+        self.path = path
+        self._entries: Dict[str, Any] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == AUDIT_CACHE_VERSION:
+                self._entries = data.get("entries", {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    @staticmethod
+    def signature(*paths: str) -> List[List[Any]]:
+        """
+        Return the (path, mtime_ns, size) of each input; missing files have
+        None for mtime_ns and size.
+        """
+        signature: List[List[Any]] = []
+        for path in paths:
+            try:
+                st = os.stat(path)
+                signature.append([path, st.st_mtime_ns, st.st_size])
+            except OSError:
+                signature.append([path, None, None])
+        return signature
+
+    def get(
+        self, key: str, signature: List[List[Any]], timestamp: str
+    ) -> Optional[List[AuditResult]]:
+        """Return cached findings for key if its inputs are unchanged."""
+        entry = self._entries.get(key)
+        if not entry or entry.get("signature") != signature:
+            return None
+        return [
+            AuditResult(**finding, timestamp=timestamp)
+            for finding in entry.get("findings", [])
+        ]
+
+    def put(
+        self, key: str, signature: List[List[Any]], findings: List[AuditResult]
+    ) -> None:
+        """Store findings for key along with the signature of their inputs."""
+        stored = [f._asdict() for f in findings]
+        for finding in stored:
+            del finding["timestamp"]
+        with self._lock:
+            self._entries[key] = {"signature": signature, "findings": stored}
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist the cache if it changed."""
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            write_json(
+                {"version": AUDIT_CACHE_VERSION, "entries": self._entries}, self.path
+            )
+            self._dirty = False
+        except OSError:
+            pass
 
 
 class SecurityAuditor:
     """Security audit functionality."""
 
-    def __init__(self):
+    def __init__(
+        self, timestamp: Optional[str] = None, cache: Optional[AuditCache] = None
+    ):
         self.results: List[AuditResult] = []
+        # Findings from one audit run share a single timestamp
+        self.timestamp = timestamp or datetime.datetime.now().isoformat()
+        self.cache = cache
 
     def audit_file_permissions(self) -> List[AuditResult]:
         """Audit file permissions for sensitive files."""
         findings: List[AuditResult] = []
 
-        # Check sensitive files and directories
-        sensitive_paths = [
-            "config/",
-            "logs/",
-            "storage/",
-            "cyber_vector_db/",
-            ".env",
-            "*.key",
-            "*.pem",
-        ]
-
-        for path_pattern in sensitive_paths:
-            if path_pattern.startswith("*."):
-                # Handle wildcard patterns
-                for file_path in Path(".").rglob(path_pattern):
-                    if file_path.exists():
-                        stat = file_path.stat()
-                        # Check if file is world-readable (simplified check)
-                        if oct(stat.st_mode)[-1] in ["4", "5", "6", "7"]:
-                            findings.append(
-                                AuditResult(
-                                    category="security",
-                                    severity="medium",
-                                    title="World-readable sensitive file",
-                                    description=f"File {file_path} may be readable by other users",
-                                    recommendation="Consider restricting file permissions",
-                                    file_path=str(file_path),
-                                )
-                            )
-            else:
-                path = Path(path_pattern)
-                if path.exists():
-                    # Basic permission check
-                    if path.is_dir() and not path_pattern.endswith("/"):
-                        continue
+        # Check sensitive files and directories. They all live in the
+        # working directory, so one listing answers every existence check.
+        try:
+            with os.scandir(".") as it:
+                root_entries = {entry.name: entry for entry in it}
+        except OSError:
+            root_entries = {}
+
+        for path_pattern in SENSITIVE_PATHS:
+            name = path_pattern.rstrip("/")
+            entry = root_entries.get(name)
+            if entry is None:
+                continue
+            is_dir = entry.is_dir()
+            if not is_dir and not entry.is_file():
+                continue  # Dangling symlink or special file
+            # Basic permission check
+            if is_dir and not path_pattern.endswith("/"):
+                continue
+
+            # Add informational finding about sensitive file locations
+            findings.append(
+                AuditResult(
+                    category="security",
+                    severity="low",
+                    title="Sensitive path detected",
+                    description=f"Sensitive path {name} exists and should be monitored",
+                    recommendation="Ensure proper access controls are in place",
+                    file_path=name,
+                    timestamp=self.timestamp,
+                )
+            )
 
-                    # Add informational finding about sensitive file locations
-                    findings.append(
-                        AuditResult(
-                            category="security",
-                            severity="low",
-                            title="Sensitive path detected",
-                            description=f"Sensitive path {path} exists and should be monitored",
-                            recommendation="Ensure proper access controls are in place",
-                            file_path=str(path),
-                        )
+        # Credential files live at the top level or under a few known
+        # directories, so only those are searched instead of the whole tree
+        candidates = itertools.chain(
+            (e for e in root_entries.values() if e.is_file(follow_symlinks=False)),
+            *(_iter_files(directory) for directory in CREDENTIAL_DIRS),
+        )
+        for entry in candidates:
+            if not entry.name.endswith(SENSITIVE_EXTENSIONS):
+                continue
+            file_path = os.path.normpath(entry.path)
+            # Check if file is world-readable (simplified check)
+            if entry.stat(follow_symlinks=False).st_mode & S_IROTH:
+                findings.append(
+                    AuditResult(
+                        category="security",
+                        severity="medium",
+                        title="World-readable sensitive file",
+                        description=f"File {file_path} may be readable by other users",
+                        recommendation="Consider restricting file permissions",
+                        file_path=file_path,
+                        timestamp=self.timestamp,
                     )
+                )
 
         return findings
 
     def audit_configuration_security(self, config_path: str) -> List[AuditResult]:
         """Audit configuration for security issues."""
+        if self.cache is None:
+            return self._scan_configuration(config_path)
+
+        key = f"config:{config_path}"
+        signature = AuditCache.signature(config_path)
+        findings = self.cache.get(key, signature, self.timestamp)
+        if findings is None:
+            findings = self._scan_configuration(config_path)
+            self.cache.put(key, signature, findings)
+        return findings
+
+    def _scan_configuration(self, config_path: str) -> List[AuditResult]:
+        """Check the configuration file for insecure settings."""
         findings: List[AuditResult] = []
 
         try:
-            from cli.runner import load_config
-
-            config = load_config(config_path)
+            config = _load_config_cached(config_path)
 
             if not config:
                 findings.append(
@@ -122,6 +282,7 @@ class SecurityAuditor:
                         description=f"Could not load configuration from {config_path}",
                         recommendation="Verify configuration file exists and is valid YAML",
                         file_path=config_path,
+                        timestamp=self.timestamp,
                     )
                 )
                 return findings
@@ -136,6 +297,7 @@ class SecurityAuditor:
                         description="Debug logging may expose sensitive information",
                         recommendation="Use INFO or WARNING level for production",
                         file_path=config_path,
+                        timestamp=self.timestamp,
                     )
                 )
 
@@ -150,36 +312,40 @@ class SecurityAuditor:
                         description="Database is configured to listen on all network interfaces",
                         recommendation="Bind to localhost or specific interfaces only",
                         file_path=config_path,
+                        timestamp=self.timestamp,
                     )
                 )
 
             # Check for API keys in config (should be in env vars)
-            def check_for_keys(obj: Any, path: str = "") -> None:
-                if isinstance(obj, dict):
-                    dict_obj = cast(Dict[str, Any], obj)
-                    for key, value in dict_obj.items():
-                        new_path = f"{path}.{key}" if path else key
-                        if isinstance(value, str) and any(
-                            word in key.lower()
-                            for word in ["key", "token", "secret", "password"]
-                        ):
-                            if value and not value.startswith(
-                                "${"
-                            ):  # Not an env var reference
-                                findings.append(
-                                    AuditResult(
-                                        category="security",
-                                        severity="critical",
-                                        title="Hardcoded credential in config",
-                                        description=f"Found potential credential in config at {new_path}",
-                                        recommendation="Use environment variables for credentials",
-                                        file_path=config_path,
-                                    )
+            # Walk nested sections with an explicit stack of item iterators,
+            # which keeps the depth-first order without recursive calls
+            stack = [(iter(cast(Dict[str, Any], config).items()), "")]
+            while stack:
+                items, path = stack[-1]
+                for key, value in items:
+                    new_path = f"{path}.{key}" if path else key
+                    if isinstance(value, str):
+                        if not SECRET_KEY_PATTERN.search(key):
+                            continue
+                        if value and not value.startswith(
+                            "${"
+                        ):  # Not an env var reference
+                            findings.append(
+                                AuditResult(
+                                    category="security",
+                                    severity="critical",
+                                    title="Hardcoded credential in config",
+                                    description=f"Found potential credential in config at {new_path}",
+                                    recommendation="Use environment variables for credentials",
+                                    file_path=config_path,
+                                    timestamp=self.timestamp,
                                 )
-                        elif isinstance(value, dict):
-                            check_for_keys(value, new_path)
-
-            check_for_keys(config)
+                            )
+                    elif isinstance(value, dict):
+                        stack.append((iter(value.items()), new_path))
+                        break
+                else:
+                    stack.pop()
 
         except Exception as e:
             findings.append(
@@ -190,6 +356,7 @@ class SecurityAuditor:
                     description=f"Error auditing configuration: {str(e)}",
                     recommendation="Investigate configuration file structure",
                     file_path=config_path,
+                    timestamp=self.timestamp,
                 )
             )
 
@@ -199,15 +366,31 @@ class SecurityAuditor:
 class DependencyAuditor:
     """Dependency audit functionality."""
 
+    def __init__(
+        self, timestamp: Optional[str] = None, cache: Optional[AuditCache] = None
+    ):
+        self.timestamp = timestamp or datetime.datetime.now().isoformat()
+        self.cache = cache
+
     def audit_dependencies(self) -> List[AuditResult]:
         """Audit Python dependencies for known vulnerabilities."""
+        if self.cache is None:
+            return self._scan_dependencies()
+
+        signature = AuditCache.signature(*REQUIREMENTS_FILES)
+        findings = self.cache.get("dependencies", signature, self.timestamp)
+        if findings is None:
+            findings = self._scan_dependencies()
+            self.cache.put("dependencies", signature, findings)
+        return findings
+
+    def _scan_dependencies(self) -> List[AuditResult]:
+        """Check requirements files for unpinned dependencies."""
         findings: List[AuditResult] = []
 
         # Check for requirements files
-        req_files = ["requirements.txt", "requirements_learning.txt"]
-
-        for req_file in req_files:
-            if Path(req_file).exists():
+        for req_file in REQUIREMENTS_FILES:
+            if os.path.exists(req_file):
                 findings.append(
                     AuditResult(
                         category="dependencies",
@@ -216,35 +399,34 @@ class DependencyAuditor:
                         description=f"Dependency file {req_file} should be regularly audited",
                         recommendation="Use 'pip audit' or 'safety check' to scan for vulnerabilities",
                         file_path=req_file,
+                        timestamp=self.timestamp,
                     )
                 )
 
         # Check for common vulnerable patterns
         try:
+            # Check for unpinned versions, streaming the file line by line
+            unpinned = 0
             with open("requirements.txt", "r") as f:
-                content = f.read()
-
-                # Check for unpinned versions
-                lines = [
-                    line.strip()
-                    for line in content.split("\n")
-                    if line.strip() and not line.startswith("#")
-                ]
-                unpinned = [
-                    line for line in lines if "==" not in line and ">=" not in line
-                ]
-
-                if unpinned:
-                    findings.append(
-                        AuditResult(
-                            category="dependencies",
-                            severity="medium",
-                            title="Unpinned dependencies detected",
-                            description=f"Found {len(unpinned)} unpinned dependencies",
-                            recommendation="Pin dependency versions for reproducible builds",
-                            file_path="requirements.txt",
-                        )
+                for raw_line in f:
+                    line = raw_line.strip()
+                    if not line or line.startswith("#"):
+                        continue
+                    if "==" not in line and ">=" not in line:
+                        unpinned += 1
+
+            if unpinned:
+                findings.append(
+                    AuditResult(
+                        category="dependencies",
+                        severity="medium",
+                        title="Unpinned dependencies detected",
+                        description=f"Found {unpinned} unpinned dependencies",
+                        recommendation="Pin dependency versions for reproducible builds",
+                        file_path="requirements.txt",
+                        timestamp=self.timestamp,
                     )
+                )
 
         except FileNotFoundError:
             findings.append(
@@ -254,6 +436,7 @@ class DependencyAuditor:
                     title="No requirements.txt found",
                     description="No dependency file found for audit",
                     recommendation="Create requirements.txt for dependency tracking",
+                    timestamp=self.timestamp,
                 )
             )
 
@@ -263,44 +446,52 @@ class DependencyAuditor:
 class DocumentAuditor:
     """Document audit functionality."""
 
+    def __init__(self, timestamp: Optional[str] = None):
+        self.timestamp = timestamp or datetime.datetime.now().isoformat()
+
     def audit_documents(self) -> List[AuditResult]:
         """Audit documents for potential security concerns."""
         findings: List[AuditResult] = []
 
-        # Check cyber_documents directory
-        docs_dir = Path("cyber_documents")
-        if docs_dir.exists():
-            doc_files = list(docs_dir.glob("*"))
+        # Check cyber_documents directory, counting entries in one pass
+        docs_dir = DOCUMENTS_DIR
+        try:
+            with os.scandir(docs_dir) as it:
+                doc_count = 0
+                sensitive_files = 0
+                for entry in it:
+                    doc_count += 1
+                    if entry.name.lower().endswith(SENSITIVE_DOCUMENT_EXTENSIONS):
+                        sensitive_files += 1
+        except OSError:
+            return findings
+
+        findings.append(
+            AuditResult(
+                category="documents",
+                severity="low",
+                title="Document collection detected",
+                description=f"Found {doc_count} files in cyber_documents directory",
+                recommendation="Ensure all documents are properly classified and access-controlled",
+                file_path=docs_dir,
+                timestamp=self.timestamp,
+            )
+        )
 
+        # Check for potentially sensitive file types
+        if sensitive_files:
             findings.append(
                 AuditResult(
                     category="documents",
-                    severity="low",
-                    title="Document collection detected",
-                    description=f"Found {len(doc_files)} files in cyber_documents directory",
-                    recommendation="Ensure all documents are properly classified and access-controlled",
-                    file_path=str(docs_dir),
+                    severity="medium",
+                    title="Sensitive document formats detected",
+                    description=f"Found {sensitive_files} potentially sensitive documents",
+                    recommendation="Review document access controls and content classification",
+                    file_path=docs_dir,
+                    timestamp=self.timestamp,
                 )
             )
 
-            # Check for potentially sensitive file types
-            sensitive_extensions = [".pdf", ".docx", ".xlsx", ".pptx"]
-            sensitive_files = [
-                f for f in doc_files if f.suffix.lower() in sensitive_extensions
-            ]
-
-            if sensitive_files:
-                findings.append(
-                    AuditResult(
-                        category="documents",
-                        severity="medium",
-                        title="Sensitive document formats detected",
-                        description=f"Found {len(sensitive_files)} potentially sensitive documents",
-                        recommendation="Review document access controls and content classification",
-                        file_path=str(docs_dir),
-                    )
-                )
-
         return findings
 
 
@@ -309,179 +500,205 @@ def handle_audit_command(args: argparse.Namespace) -> None:
     print("🔍 PepeluGPT Security Audit")
     print("=" * 40)
 
-    # Initialize auditors
-    security_auditor = SecurityAuditor()
-    dependency_auditor = DependencyAuditor()
-    document_auditor = DocumentAuditor()
+    # Configuration is parsed at most once per run
+    _load_config_cached.cache_clear()
 
-    all_findings: List[AuditResult] = []
+    # Initialize auditors with a shared run timestamp and findings cache
+    run_timestamp = datetime.datetime.now().isoformat()
+    audit_cache = AuditCache()
+    security_auditor = SecurityAuditor(run_timestamp, audit_cache)
+    dependency_auditor = DependencyAuditor(run_timestamp, audit_cache)
+    document_auditor = DocumentAuditor(run_timestamp)
 
-    # Run selected audits
+    # Select audits to run
+    audits: List[Callable[[], List[AuditResult]]] = []
+    config_audited = False
     if args.type in ["security", "all"]:
         print("🛡️  Running security audit...")
-        all_findings.extend(security_auditor.audit_file_permissions())
-        all_findings.extend(security_auditor.audit_configuration_security(args.config))
+        audits.append(security_auditor.audit_file_permissions)
+        audits.append(
+            partial(security_auditor.audit_configuration_security, args.config)
+        )
+        config_audited = True
 
     if args.type in ["dependencies", "all"]:
         print("📦 Running dependency audit...")
-        all_findings.extend(dependency_auditor.audit_dependencies())
+        audits.append(dependency_auditor.audit_dependencies)
 
     if args.type in ["documents", "all"]:
         print("📄 Running document audit...")
-        all_findings.extend(document_auditor.audit_documents())
+        audits.append(document_auditor.audit_documents)
 
-    if args.type in ["config", "all"]:
+    if args.type in ["config", "all"] and not config_audited:
         print("⚙️ Running configuration audit...")
         # Reuse security config audit
-        all_findings.extend(security_auditor.audit_configuration_security(args.config))
-
-    # Filter by severity if specified
-    if args.severity:
-        severity_order = {"low": 0, "medium": 1, "high": 2, "critical": 3}
-        min_level = severity_order[args.severity]
-        all_findings = [
-            f for f in all_findings if severity_order.get(f.severity, 0) >= min_level
-        ]
+        audits.append(
+            partial(security_auditor.audit_configuration_security, args.config)
+        )
+
+    # Audits are filesystem bound, so run them concurrently and collect the
+    # results in submission order to keep reports stable
+    all_findings: List[AuditResult] = []
+    with ThreadPoolExecutor(max_workers=max(len(audits), 1)) as executor:
+        futures = [executor.submit(audit) for audit in audits]
+        for future in futures:
+            all_findings.extend(future.result())
+
+    audit_cache.save()
+
+    # Filter by severity, count severities and serialize findings in one
+    # pass; each finding's rank is looked up once and reused for both
+    min_level = SEVERITY_RANK[args.severity] if args.severity else 0
+    counts = [0] * len(SEVERITY_LEVELS)
+    findings_data: List[Dict[str, Any]] = []
+    for finding in all_findings:
+        rank = SEVERITY_RANK.get(finding.severity)
+        if rank is None:
+            # Unknown severities rank as low and are left out of the summary
+            if min_level > 0:
+                continue
+        elif rank < min_level:
+            continue
+        else:
+            counts[rank] += 1
+        findings_data.append(finding.to_dict())
+
+    summary = {level: counts[SEVERITY_RANK[level]] for level in SUMMARY_ORDER}
 
     # Generate report
     audit_report: Dict[str, Any] = {
         "audit_info": {
-            "timestamp": datetime.datetime.now().isoformat(),
+            "timestamp": run_timestamp,
             "audit_type": args.type,
             "severity_filter": args.severity,
-            "total_findings": len(all_findings),
-        },
-        "summary": {
-            "critical": len([f for f in all_findings if f.severity == "critical"]),
-            "high": len([f for f in all_findings if f.severity == "high"]),
-            "medium": len([f for f in all_findings if f.severity == "medium"]),
-            "low": len([f for f in all_findings if f.severity == "low"]),
+            "total_findings": len(findings_data),
         },
-        "findings": [f.to_dict() for f in all_findings],
+        "summary": summary,
+        "findings": findings_data,
     }
 
     # Save to audit history (Phase 4 preview)
-    try:
-        from cli.audit_history import AuditHistoryManager
-
-        history_manager = AuditHistoryManager()
-        history_file = history_manager.save_audit_report(audit_report, args.type)
-        print(f"📝 Audit saved to history: {history_file}")
-    except Exception as e:
-        print(f"⚠️ Could not save to audit history: {e}")
+    if get_history_manager is None:
+        print("⚠️ Could not save to audit history: history module is not available")
+    else:
+        try:
+            history_manager = get_history_manager()
+            history_file = history_manager.save_audit_report(audit_report, args.type)
+            print(f"📝 Audit saved to history: {history_file}")
+        except Exception as e:
+            print(f"⚠️ Could not save to audit history: {e}")
 
     # Output results
-    if args.output == "json":
-        output = json.dumps(audit_report, indent=2)
-    elif args.output == "markdown":
-        output = format_audit_markdown(audit_report)
-    else:  # text
-        output = format_audit_text(audit_report)
-
-    # Save to file if requested
     if args.save:
-        with open(args.save, "w", encoding="utf-8") as f:
-            f.write(output)
+        if args.output == "json":
+            # Serialize straight to the file without an intermediate string
+            write_json(audit_report, args.save)
+        else:
+            with open(args.save, "w", encoding="utf-8") as f:
+                f.write(format_audit_report(audit_report, args.output))
         print(f"📁 Audit report saved to {args.save}")
     else:
-        print(output)
+        print(format_audit_report(audit_report, args.output))
+
+
+def format_audit_report(report: Dict[str, Any], output_format: str) -> str:
+    """Format audit report in the requested output format."""
+    if output_format == "json":
+        return dumps_json(report)
+    elif output_format == "markdown":
+        return format_audit_markdown(report)
+    else:  # text
+        return format_audit_text(report)
 
 
 def format_audit_text(report: Dict[str, Any]) -> str:
     """Format audit report as human-readable text."""
-    output: List[str] = []
+    output = io.StringIO()
+    write = output.write
 
     # Summary
     summary = report["summary"]
     total = sum(summary.values())
 
-    output.append(f"\n📊 Audit Summary ({total} findings)")
-    output.append("-" * 30)
+    write(f"\n📊 Audit Summary ({total} findings)\n")
+    write("-" * 30)
 
     if summary["critical"] > 0:
-        output.append(f"🔴 Critical: {summary['critical']}")
+        write(f"\n🔴 Critical: {summary['critical']}")
     if summary["high"] > 0:
-        output.append(f"🟠 High: {summary['high']}")
+        write(f"\n🟠 High: {summary['high']}")
     if summary["medium"] > 0:
-        output.append(f"🟡 Medium: {summary['medium']}")
+        write(f"\n🟡 Medium: {summary['medium']}")
     if summary["low"] > 0:
-        output.append(f"🔵 Low: {summary['low']}")
+        write(f"\n🔵 Low: {summary['low']}")
 
     if total == 0:
-        output.append("✅ No findings detected!")
-        return "\n".join(output)
+        write("\n✅ No findings detected!")
+        return output.getvalue()
 
     # Findings
-    output.append(f"\n🔍 Detailed Findings")
-    output.append("=" * 40)
+    write("\n\n🔍 Detailed Findings\n")
+    write("=" * 40)
 
     for i, finding in enumerate(report["findings"], 1):
-        severity_icon = {
-            "critical": "🔴",
-            "high": "🟠",
-            "medium": "🟡",
-            "low": "🔵",
-        }.get(finding["severity"], "⚪")
-
-        output.append(
-            f"\n{i}. {severity_icon} {finding['title']} ({finding['severity'].upper()})"
+        severity_icon = SEVERITY_ICONS.get(finding["severity"], "⚪")
+
+        write(
+            f"\n\n{i}. {severity_icon} {finding['title']} ({finding['severity'].upper()})"
         )
-        output.append(f"   Category: {finding['category']}")
-        output.append(f"   Description: {finding['description']}")
+        write(f"\n   Category: {finding['category']}")
+        write(f"\n   Description: {finding['description']}")
 
         if finding["file_path"]:
-            output.append(f"   File: {finding['file_path']}")
+            write(f"\n   File: {finding['file_path']}")
 
         if finding["recommendation"]:
-            output.append(f"   💡 Recommendation: {finding['recommendation']}")
+            write(f"\n   💡 Recommendation: {finding['recommendation']}")
 
-    return "\n".join(output)
+    return output.getvalue()
 
 
 def format_audit_markdown(report: Dict[str, Any]) -> str:
     """Format audit report as Markdown."""
-    output: List[str] = []
+    output = io.StringIO()
+    write = output.write
 
-    output.append("# 🔍 PepeluGPT Security Audit Report")
-    output.append(f"\n**Generated:** {report['audit_info']['timestamp']}")
-    output.append(f"**Audit Type:** {report['audit_info']['audit_type']}")
+    write("# 🔍 PepeluGPT Security Audit Report\n")
+    write(f"\n**Generated:** {report['audit_info']['timestamp']}")
+    write(f"\n**Audit Type:** {report['audit_info']['audit_type']}")
 
     # Summary
     summary = report["summary"]
     total = sum(summary.values())
 
-    output.append(f"\n## 📊 Summary ({total} findings)")
-    output.append("\n| Severity | Count |")
-    output.append("|----------|-------|")
-    output.append(f"| 🔴 Critical | {summary['critical']} |")
-    output.append(f"| 🟠 High | {summary['high']} |")
-    output.append(f"| 🟡 Medium | {summary['medium']} |")
-    output.append(f"| 🔵 Low | {summary['low']} |")
+    write(f"\n\n## 📊 Summary ({total} findings)\n")
 
     if total == 0:
-        output.append("\n✅ **No security findings detected!**")
-        return "\n".join(output)
+        write("\n✅ **No security findings detected!**")
+        return output.getvalue()
+
+    write("\n| Severity | Count |")
+    write("\n|----------|-------|")
+    write(f"\n| 🔴 Critical | {summary['critical']} |")
+    write(f"\n| 🟠 High | {summary['high']} |")
+    write(f"\n| 🟡 Medium | {summary['medium']} |")
+    write(f"\n| 🔵 Low | {summary['low']} |")
 
     # Findings
-    output.append(f"\n## 🔍 Detailed Findings")
+    write("\n\n## 🔍 Detailed Findings")
 
     for i, finding in enumerate(report["findings"], 1):
-        severity_icon = {
-            "critical": "🔴",
-            "high": "🟠",
-            "medium": "🟡",
-            "low": "🔵",
-        }.get(finding["severity"], "⚪")
-
-        output.append(f"\n### {i}. {severity_icon} {finding['title']}")
-        output.append(f"\n**Severity:** {finding['severity'].upper()}")
-        output.append(f"**Category:** {finding['category']}")
-        output.append(f"**Description:** {finding['description']}")
+        severity_icon = SEVERITY_ICONS.get(finding["severity"], "⚪")
+
+        write(f"\n\n### {i}. {severity_icon} {finding['title']}\n")
+        write(f"\n**Severity:** {finding['severity'].upper()}")
+        write(f"\n**Category:** {finding['category']}")
+        write(f"\n**Description:** {finding['description']}")
 
         if finding["file_path"]:
-            output.append(f"**File:** `{finding['file_path']}`")
+            write(f"\n**File:** `{finding['file_path']}`")
 
         if finding["recommendation"]:
-            output.append(f"**💡 Recommendation:** {finding['recommendation']}")
+            write(f"\n**💡 Recommendation:** {finding['recommendation']}")
 
-    return "\n".join(output)
+    return output.getvalue()
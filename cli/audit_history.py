@@ -4,10 +4,48 @@ Audit history management for PepeluGPT CLI.
 Phase 4 preview: Temporal intelligence and audit tracking.
 """
 
+import calendar
 import datetime
-import json
+import heapq
+import os
+import re
+import sqlite3
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypedDict,
+    Union,
+    cast,
+)
+
+from cli.serialization import read_json, write_json_merged
+
+try:
+    import ijson  # type: ignore
+
+    has_ijson = True
+except ImportError:
+    ijson = None  # type: ignore
+    has_ijson = False
+
+# Make it available as a module constant
+HAS_IJSON: bool = has_ijson
+
+# Errors raised when a report file is not valid JSON
+_JSON_ERRORS: tuple = (ValueError, ijson.JSONError) if HAS_IJSON else (ValueError,)
 
 
 class AuditMetadata(TypedDict):
@@ -90,98 +128,613 @@ class ComparisonResult(TypedDict):
     changes: ComparisonChanges
 
 
+# Summary index kept alongside the reports in the history directory
+INDEX_FILENAME = ".index.sqlite"
+
+# Bump when the index schema changes; older index files are rebuilt
+_INDEX_SCHEMA_VERSION = 2
+
+# Index column holding each trend metric
+_TREND_METRIC_COLUMNS = {
+    "total_findings": "total_findings",
+    "critical_findings": "critical",
+    "high_findings": "high",
+}
+
+
+# Shared stand-in for missing report sections; never mutated
+_EMPTY: Dict[str, Any] = {}
+
+# Severity buckets of a report summary, most severe first
+_SEVERITIES = ("critical", "high", "medium", "low")
+
+
+def _severity_counts(summary: Dict[str, Any]) -> AuditSummary:
+    """Per-severity finding counts of a report summary, defaulting to 0."""
+    return cast(
+        AuditSummary, {k: summary[k] if k in summary else 0 for k in _SEVERITIES}
+    )
+
+
+class _AuditRow(NamedTuple):
+    """
+    Compact listing entry for one report. Rows are what the index, parser and
+    sorting pass around; they become AuditReportSummary dicts only on return.
+    """
+
+    file_path: str
+    file_size: int
+    audit_type: str
+    timestamp: str
+    total_findings: int
+    critical: int
+    high: int
+    medium: int
+    low: int
+
+    def to_summary(self) -> AuditReportSummary:
+        """Project to the public listing summary shape."""
+        return {
+            "file_path": self.file_path,
+            "timestamp": self.timestamp,
+            "audit_type": self.audit_type,
+            "total_findings": self.total_findings,
+            "summary": {
+                "critical": self.critical,
+                "high": self.high,
+                "medium": self.medium,
+                "low": self.low,
+            },
+            "file_size": self.file_size,
+        }
+
+
+def _summarize_report(
+    report: Dict[str, Any],
+    file_path: str,
+    file_size: int,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> _AuditRow:
+    """
+    Extract the listing summary fields from a full audit report, optionally
+    taking its metadata section separately.
+    """
+    if metadata is None:
+        metadata = report.get("metadata") or _EMPTY
+    audit_info = report.get("audit_info") or _EMPTY
+    counts = _severity_counts(report.get("summary") or _EMPTY)
+    return _AuditRow(
+        file_path,
+        file_size,
+        metadata["audit_type"] if "audit_type" in metadata else "unknown",
+        metadata["saved_at"] if "saved_at" in metadata else "unknown",
+        audit_info["total_findings"] if "total_findings" in audit_info else 0,
+        counts["critical"],
+        counts["high"],
+        counts["medium"],
+        counts["low"],
+    )
+
+
+def _iso_to_epoch(value: Any) -> Optional[float]:
+    """Epoch seconds for an ISO-8601 timestamp, or None if it does not parse."""
+    try:
+        return datetime.datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+# Report filenames: audit_<type>_<YYYYMMDD>_<HHMMSS>.json
+_STAMP_RE = re.compile(r"audit_(?P<type>.+)_(?P<date>\d{8})_(?P<time>\d{6})\.json$")
+
+
+def _filename_stamp(file_path: str) -> str:
+    """A report filename's YYYYMMDDHHMMSS digits, or "" if it has none."""
+    match = _STAMP_RE.search(os.path.basename(file_path))
+    return match["date"] + match["time"] if match else ""
+
+
+def _stamp_seconds(date: str, time: str) -> int:
+    """
+    Seconds for a filename's YYYYMMDD and HHMMSS digits, read as UTC so the
+    result only needs to compare against other wall-clock times the same way.
+    """
+    return calendar.timegm(
+        (
+            int(date[:4]),
+            int(date[4:6]),
+            int(date[6:]),
+            int(time[:2]),
+            int(time[2:4]),
+            int(time[4:]),
+            0,
+            0,
+            0,
+        )
+    )
+
+
+# JSON paths of the scalar fields a listing needs from each report
+_SUMMARY_FIELD_PATHS = frozenset(
+    {
+        "metadata.saved_at",
+        "metadata.audit_type",
+        "audit_info.total_findings",
+        "summary.critical",
+        "summary.high",
+        "summary.medium",
+        "summary.low",
+    }
+)
+
+
+def _extract_summary_fields(file_path: Path, file_size: int) -> _AuditRow:
+    """
+    Read only the summary fields of a report. With ijson installed the file
+    is streamed and parsing stops once every field has been seen, so the
+    findings array that follows the header is never parsed.
+    """
+    if not HAS_IJSON:
+        report = read_json(file_path)
+        return _summarize_report(report, str(file_path), file_size)
+
+    fields: Dict[str, Any] = {}
+    with open(file_path, "rb") as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix in _SUMMARY_FIELD_PATHS and event in ("string", "number"):
+                fields[prefix] = value
+                if len(fields) == len(_SUMMARY_FIELD_PATHS):
+                    break
+
+    # Missing fields take the same defaults as _summarize_report
+    get = fields.get
+    return _AuditRow(
+        str(file_path),
+        file_size,
+        get("metadata.audit_type", "unknown"),
+        get("metadata.saved_at", "unknown"),
+        int(get("audit_info.total_findings", 0)),
+        int(get("summary.critical", 0)),
+        int(get("summary.high", 0)),
+        int(get("summary.medium", 0)),
+        int(get("summary.low", 0)),
+    )
+
+
+def _read_summary(file_path: Path, st: os.stat_result) -> Optional[_AuditRow]:
+    """Read a report's summary fields, or None if the file is unreadable."""
+    try:
+        return _extract_summary_fields(file_path, st.st_size)
+    except (*_JSON_ERRORS, FileNotFoundError):
+        return None  # Skip corrupted files
+
+
+@lru_cache(maxsize=16)
+def _load_baseline(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a baseline report. Keyed on the file's mtime and size so repeated
+    comparisons against an unchanged baseline parse it once. Callers must not
+    mutate the result.
+    """
+    return read_json(path)
+
+
+def _numbered_subdirs(path: Union[str, Path]) -> List[os.DirEntry]:
+    """Subdirectories of path named by a number (years, months), highest first."""
+    try:
+        with os.scandir(path) as entries:
+            dirs = [e for e in entries if e.name.isdigit() and e.is_dir()]
+    except FileNotFoundError:
+        return []
+    dirs.sort(key=lambda e: int(e.name), reverse=True)
+    return dirs
+
+
+class _TrendStats(NamedTuple):
+    """Figures a trend summary is built from."""
+
+    data_points: List[TrendDataPoint]  # Oldest date first
+    current: int  # Value of the newest report
+    average: float
+    count: int
+    oldest_average: float  # Mean of the four oldest values
+    newest_average: float  # Mean of the four newest values
+
+
+def _trend_stats(points: List[Tuple[str, int]]) -> Optional[_TrendStats]:
+    """
+    Trend figures from (saved_at, value) pairs ordered newest first, in one
+    pass. Used when there is no index to compute them in SQL.
+    """
+    values: List[TrendDataPoint] = []
+    total = 0
+    newest: List[int] = []  # First four values, i.e. the newest reports
+    oldest: Deque[int] = deque(maxlen=4)  # Last four, the oldest reports
+    for saved_at, value in points:
+        values.append({
+            "date": saved_at[:10],  # YYYY-MM-DD
+            "value": value
+        })
+        total += value
+        if len(newest) < 4:
+            newest.append(value)
+        oldest.append(value)
+
+    if not values:
+        return None
+    return _TrendStats(
+        sorted(values, key=lambda x: x["date"]),
+        newest[0],
+        total / len(values),
+        len(values),
+        sum(oldest) / len(oldest),
+        sum(newest) / len(newest),
+    )
+
+
+class _IndexStore:
+    """
+    Persistent SQLite index of report summaries keyed on (path, mtime_ns, size),
+    so unchanged reports are listed without opening and parsing them.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._conn = sqlite3.connect(str(db_path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+        with self._conn:
+            if version != _INDEX_SCHEMA_VERSION:
+                # The index only caches report files, so it is simply rebuilt
+                self._conn.execute("DROP TABLE IF EXISTS files")
+                self._conn.execute(f"PRAGMA user_version = {_INDEX_SCHEMA_VERSION}")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS files (
+                    path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    audit_type TEXT,
+                    saved_at TEXT,
+                    saved_at_epoch REAL,
+                    total_findings INTEGER,
+                    critical INTEGER,
+                    high INTEGER,
+                    medium INTEGER,
+                    low INTEGER
+                )
+            """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS files_saved_at_epoch"
+                " ON files (saved_at_epoch)"
+            )
+
+    def load_month(self, month_dir: Path) -> Dict[str, Tuple[int, _AuditRow]]:
+        """
+        Return every indexed row under month_dir in one query, keyed by path,
+        as (mtime_ns, row). The primary-key index serves the path range
+        directly.
+        """
+        prefix = str(month_dir) + os.sep
+        upper = prefix[:-1] + chr(ord(os.sep) + 1)
+        rows = self._conn.execute(
+            """
+            SELECT path, mtime_ns, size, audit_type, saved_at,
+                   total_findings, critical, high, medium, low
+            FROM files WHERE path >= ? AND path < ?
+        """,
+            (prefix, upper),
+        )
+        return {row[0]: (row[1], _AuditRow(row[0], *row[2:])) for row in rows}
+
+    def store_many(self, entries: List[Tuple[_AuditRow, int]]) -> None:
+        """Insert or refresh index rows for (row, mtime_ns) pairs in one batch."""
+        with self._conn:
+            self._conn.executemany(
+                """
+                INSERT OR REPLACE INTO files (
+                    path, mtime_ns, size, audit_type, saved_at, saved_at_epoch,
+                    total_findings, critical, high, medium, low
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                [
+                    (
+                        row.file_path,
+                        mtime_ns,
+                        row.file_size,
+                        row.audit_type,
+                        row.timestamp,
+                        _iso_to_epoch(row.timestamp),
+                        row.total_findings,
+                        row.critical,
+                        row.high,
+                        row.medium,
+                        row.low,
+                    )
+                    for row, mtime_ns in entries
+                ],
+            )
+
+    def trend_stats(
+        self, paths: List[str], since_epoch: float, metric: str
+    ) -> Optional[_TrendStats]:
+        """
+        Trend figures for the given report paths saved at or after
+        since_epoch, computed in one query with window functions. Reports
+        whose saved_at does not parse have no epoch and are left out by the
+        range filter.
+        """
+        column = _TREND_METRIC_COLUMNS.get(metric, "total_findings")
+        placeholders = ", ".join("?" * len(paths))
+        rows = self._conn.execute(
+            f"""
+            WITH w AS (
+                SELECT substr(saved_at, 1, 10) AS day, saved_at_epoch,
+                       {column} AS v,
+                       ROW_NUMBER() OVER (ORDER BY saved_at_epoch DESC) AS recent,
+                       ROW_NUMBER() OVER (ORDER BY saved_at_epoch) AS early
+                FROM files
+                WHERE saved_at_epoch >= ? AND path IN ({placeholders})
+            )
+            SELECT day, v,
+                   MAX(CASE WHEN recent = 1 THEN v END) OVER (),
+                   AVG(v) OVER (),
+                   COUNT(*) OVER (),
+                   AVG(CASE WHEN early <= 4 THEN v END) OVER (),
+                   AVG(CASE WHEN recent <= 4 THEN v END) OVER ()
+            FROM w
+            ORDER BY day, saved_at_epoch DESC
+        """,
+            (since_epoch, *paths),
+        ).fetchall()
+        if not rows:
+            return None
+        _, _, current, average, count, oldest_average, newest_average = rows[0]
+        return _TrendStats(
+            [{"date": day, "value": value} for day, value, *_ in rows],
+            current,
+            average,
+            count,
+            oldest_average,
+            newest_average,
+        )
+
+
 class AuditHistoryManager:
     """Manages audit history storage and retrieval."""
 
     def __init__(self, history_dir: str = "audit_history"):
         self.history_dir = Path(history_dir)
         self.history_dir.mkdir(exist_ok=True)
+        try:
+            self._index: Optional[_IndexStore] = _IndexStore(
+                self.history_dir / INDEX_FILENAME
+            )
+        except sqlite3.Error:
+            self._index = None  # Listing still works by parsing every report
 
     def save_audit_report(self, report: Dict[str, Any], audit_type: str = "all") -> str:
         """Save an audit report to history."""
         timestamp = datetime.datetime.now()
+        year, month = timestamp.year, timestamp.month
 
         # Create year/month directory structure
-        year_month_dir = (
-            self.history_dir / str(timestamp.year) / f"{timestamp.month:02d}"
-        )
+        year_month_dir = self.history_dir / str(year) / f"{month:02d}"
         year_month_dir.mkdir(parents=True, exist_ok=True)
 
         # Generate filename
-        timestamp_str = timestamp.strftime("%Y%m%d_%H%M%S")
+        timestamp_str = (
+            f"{year:04d}{month:02d}{timestamp.day:02d}_"
+            f"{timestamp.hour:02d}{timestamp.minute:02d}{timestamp.second:02d}"
+        )
         filename = f"audit_{audit_type}_{timestamp_str}.json"
         file_path = year_month_dir / filename
 
-        # Add metadata to report
-        enhanced_report: Dict[str, Any] = {
-            **report,
-            "metadata": {
-                "saved_at": timestamp.isoformat(),
-                "audit_type": audit_type,
-                "file_path": str(file_path),
-                "pepelugpt_version": "1.1.0",
-            },
+        # Add metadata to report. It is written first so that listings can
+        # stop reading before the findings array, and is spliced onto the
+        # serialized report rather than merged into a copy of it.
+        metadata: Dict[str, Any] = {
+            "saved_at": timestamp.isoformat(),
+            "audit_type": audit_type,
+            "file_path": str(file_path),
+            "pepelugpt_version": "1.1.0",
         }
+        body = (
+            {key: value for key, value in report.items() if key != "metadata"}
+            if "metadata" in report
+            else report
+        )
 
         # Save to file
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(enhanced_report, f, indent=2)
-
-        return str(file_path)
+        write_json_merged({"metadata": metadata}, body, file_path)
 
-    def list_audit_reports(
-        self, limit: int = 10, audit_type: Optional[str] = None
-    ) -> List[AuditReportSummary]:
-        """List recent audit reports."""
-        reports: List[AuditReportSummary] = []
+        # Write the summary through to the index so listings stay warm
+        if self._index is not None:
+            st = file_path.stat()
+            row = _summarize_report(body, str(file_path), st.st_size, metadata)
+            self._index.store_many([(row, st.st_mtime_ns)])
 
-        # Walk through history directory
-        for file_path in self.history_dir.rglob("audit_*.json"):
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    report = json.load(f)
+        return str(file_path)
 
-                # Filter by audit type if specified
+    def _iter_report_files(
+        self,
+        since: Optional[datetime.datetime] = None,
+        until: Optional[datetime.datetime] = None,
+        audit_type: Optional[str] = None,
+    ) -> Iterator[Tuple[Path, os.stat_result]]:
+        """
+        Yield (path, stat) for report files under the year/month tree, newest
+        first, skipping whole months and individual files whose filename
+        timestamp falls outside the window or whose filename names another
+        audit type. Files are only stat'ed as they are yielded, so a consumer
+        that stops early pays for what it used.
+        """
+        prefix = f"audit_{audit_type}_" if audit_type else "audit_"
+        # Filename stamps are wall-clock seconds; compare windows the same way
+        since_secs = calendar.timegm(since.timetuple()) if since else None
+        until_secs = calendar.timegm(until.timetuple()) if until else None
+        since_month = since.year * 100 + since.month if since else None
+        until_month = until.year * 100 + until.month if until else None
+
+        for year_entry in _numbered_subdirs(self.history_dir):
+            for month_entry in _numbered_subdirs(year_entry.path):
+                year_month = int(year_entry.name) * 100 + int(month_entry.name)
+                if until_month is not None and year_month > until_month:
+                    continue
+                if since_month is not None and year_month < since_month:
+                    return  # Every remaining month is older still
+                boundary = year_month in (since_month, until_month)
+
+                # The YYYYMMDD_HHMMSS suffix sorts chronologically; the
+                # audit-type prefix in front of it does not
+                stamped: List[Tuple[str, Optional[int], os.DirEntry]] = []
+                with os.scandir(month_entry.path) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if not (name.startswith(prefix) and name.endswith(".json")):
+                            continue
+                        if not entry.is_file():
+                            continue
+                        match = _STAMP_RE.search(name)
+                        if match is None:
+                            stamped.append(("", None, entry))
+                            continue
+                        if audit_type and match["type"] != audit_type:
+                            continue  # e.g. audit_all_x_... when asked for "all"
+                        date, time = match.group("date", "time")
+                        seconds = _stamp_seconds(date, time) if boundary else None
+                        stamped.append((date + time, seconds, entry))
+                stamped.sort(key=lambda item: item[0], reverse=True)
+
+                for _, seconds, entry in stamped:
+                    if seconds is not None and (
+                        (since_secs is not None and seconds < since_secs)
+                        or (until_secs is not None and seconds > until_secs)
+                    ):
+                        continue
+                    try:
+                        st = entry.stat()
+                    except FileNotFoundError:
+                        continue  # Removed since the directory was read
+                    yield Path(entry.path), st
+
+    def _summarize_files(
+        self, files: List[Tuple[Path, os.stat_result]]
+    ) -> List[_AuditRow]:
+        """
+        Listing rows for the given (path, stat) report files, served from the
+        index where the file is unchanged and parsed otherwise. Unreadable
+        files are dropped.
+        """
+        # Rows stay in the order of `files`; misses are filled in after parsing
+        rows: List[Optional[_AuditRow]] = [None] * len(files)
+        misses: List[Tuple[int, Path, os.stat_result]] = []
+        # Index rows are loaded once per month directory, not once per file
+        month_rows: Dict[Path, Dict[str, Tuple[int, _AuditRow]]] = {}
+
+        for position, (file_path, st) in enumerate(files):
+            # Unchanged reports are served from the index without parsing
+            if self._index is not None:
+                month_dir = file_path.parent
+                indexed = month_rows.get(month_dir)
+                if indexed is None:
+                    indexed = month_rows[month_dir] = self._index.load_month(
+                        month_dir
+                    )
+                hit = indexed.get(str(file_path))
                 if (
-                    audit_type
-                    and report.get("metadata", {}).get("audit_type") != audit_type
+                    hit is not None
+                    and hit[0] == st.st_mtime_ns
+                    and hit[1].file_size == st.st_size
                 ):
+                    rows[position] = hit[1]
                     continue
+            misses.append((position, file_path, st))
 
-                # Extract summary info
-                report_summary = report.get("summary", {})
-                summary: AuditReportSummary = {
-                    "file_path": str(file_path),
-                    "timestamp": report.get("metadata", {}).get("saved_at", "unknown"),
-                    "audit_type": report.get("metadata", {}).get(
-                        "audit_type", "unknown"
-                    ),
-                    "total_findings": report.get("audit_info", {}).get(
-                        "total_findings", 0
-                    ),
-                    "summary": {
-                        "critical": report_summary.get("critical", 0),
-                        "high": report_summary.get("high", 0),
-                        "medium": report_summary.get("medium", 0),
-                        "low": report_summary.get("low", 0),
-                    },
-                    "file_size": file_path.stat().st_size,
-                }
-                reports.append(summary)
-
-            except (json.JSONDecodeError, FileNotFoundError):
-                continue  # Skip corrupted files
-
-        # Sort by timestamp (newest first) and limit
-        reports.sort(key=lambda x: x["timestamp"], reverse=True)
-        return reports[:limit]
+        # Parse new or changed reports concurrently; reads are I/O bound
+        if misses:
+            if len(misses) == 1:
+                parsed = [_read_summary(*misses[0][1:])]
+            else:
+                workers = min(len(misses), 32, (os.cpu_count() or 1) * 4)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    parsed = list(
+                        executor.map(lambda m: _read_summary(*m[1:]), misses)
+                    )
+
+            fresh: List[Tuple[_AuditRow, int]] = []
+            for (position, _, st), row in zip(misses, parsed):
+                if row is not None:
+                    rows[position] = row
+                    fresh.append((row, st.st_mtime_ns))
+            if self._index is not None and fresh:
+                self._index.store_many(fresh)
+
+        return [row for row in rows if row is not None]
+
+    def _iter_rows(
+        self,
+        batch_size: int,
+        audit_type: Optional[str] = None,
+        since: Optional[datetime.datetime] = None,
+        until: Optional[datetime.datetime] = None,
+    ) -> Iterator[_AuditRow]:
+        """
+        Yield report rows newest file first. Files are summarized batch_size
+        at a time, so a consumer that stops early leaves the rest unread.
+        """
+        files = self._iter_report_files(since, until, audit_type)
+        while True:
+            batch = list(islice(files, batch_size))
+            if not batch:
+                return
+            for row in self._summarize_files(batch):
+                # Filenames carry the type too, but the report has the final say
+                if not audit_type or row.audit_type == audit_type:
+                    yield row
+
+    def _list_rows(
+        self,
+        limit: int,
+        audit_type: Optional[str] = None,
+        since: Optional[datetime.datetime] = None,
+        until: Optional[datetime.datetime] = None,
+    ) -> List[_AuditRow]:
+        """Rows of the newest `limit` reports, newest first."""
+        if limit <= 0:
+            return []
+        rows = self._iter_rows(limit, audit_type, since, until)
+        page = list(islice(rows, limit))
+        if len(page) == limit:
+            # Filenames only order to the second, so reports stamped the same
+            # second as the last row compete for the page by saved timestamp
+            boundary = _filename_stamp(page[-1].file_path)
+            for row in rows:
+                if _filename_stamp(row.file_path) != boundary:
+                    break
+                page.append(row)
+        return heapq.nlargest(limit, page, key=attrgetter("timestamp"))
+
+    def list_audit_reports(
+        self,
+        limit: int = 10,
+        audit_type: Optional[str] = None,
+        since: Optional[datetime.datetime] = None,
+        until: Optional[datetime.datetime] = None,
+    ) -> List[AuditReportSummary]:
+        """List recent audit reports, optionally within a saved-time window."""
+        return [
+            row.to_summary()
+            for row in self._list_rows(limit, audit_type, since, until)
+        ]
 
     def get_audit_trend(
         self, days: int = 30, metric: str = "total_findings"
     ) -> TrendData:
         """Analyze audit trends over time."""
-        cutoff_date = datetime.datetime.now() - datetime.timedelta(days=days)
         end_date = datetime.datetime.now()
+        cutoff_date = end_date - datetime.timedelta(days=days)
 
         trends: TrendData = {
             "metric": metric,
@@ -197,65 +750,52 @@ class AuditHistoryManager:
             },
         }
 
-        reports = self.list_audit_reports(limit=100)  # Get more for trend analysis
+        # Get more for trend analysis; files outside the window are never opened.
+        # Listing also brings their index rows up to date.
+        reports = self._list_rows(limit=100, since=cutoff_date)
 
-        # Filter reports within date range
-        relevant_reports: List[AuditReportSummary] = []
-        for report in reports:
-            try:
-                report_date = datetime.datetime.fromisoformat(
-                    report["timestamp"].replace("Z", "+00:00")
-                )
-                if report_date >= cutoff_date:
-                    relevant_reports.append(report)
-            except (ValueError, TypeError):
-                continue
-
-        if not relevant_reports:
+        # Filter reports within date range and reduce them to the summary
+        # figures. With an index this all happens in one SQL query.
+        stats: Optional[_TrendStats]
+        if self._index is not None:
+            stats = self._index.trend_stats(
+                [r.file_path for r in reports], cutoff_date.timestamp(), metric
+            )
+        else:
+            cutoff_epoch = cutoff_date.timestamp()
+            column = _TREND_METRIC_COLUMNS.get(metric, "total_findings")
+            points: List[Tuple[str, int]] = []
+            for report in reports:
+                epoch = _iso_to_epoch(report.timestamp)
+                if epoch is not None and epoch >= cutoff_epoch:
+                    points.append((report.timestamp, getattr(report, column)))
+            stats = _trend_stats(points)
+
+        if stats is None:
             return trends
 
-        # Extract metric values
-        values: List[TrendDataPoint] = []
-        for report in relevant_reports:
-            value: int
-            if metric == "total_findings":
-                value = report["total_findings"]
-            elif metric == "critical_findings":
-                value = report["summary"]["critical"]
-            elif metric == "high_findings":
-                value = report["summary"]["high"]
-            else:
-                value = report["total_findings"]  # Default
-
-            values.append({
-                "date": report["timestamp"][:10],  # YYYY-MM-DD
-                "value": value
-            })
-
-        trends["data_points"] = sorted(values, key=lambda x: x["date"])
+        trends["data_points"] = stats.data_points
 
         # Calculate summary statistics
-        if values:
-            value_list = [v["value"] for v in values]
-            trends["summary"]["current"] = value_list[0] if value_list else 0
-            trends["summary"]["average"] = sum(value_list) / len(value_list)
-
-            # Simple trend analysis (compare first and last quarters)
-            if len(value_list) >= 4:
-                first_quarter = sum(value_list[-4:]) / 4  # Most recent
-                last_quarter = sum(value_list[:4]) / 4  # Oldest
-
-                if first_quarter < last_quarter * 0.9:
-                    trends["summary"]["trend"] = "improving"
-                elif first_quarter > last_quarter * 1.1:
-                    trends["summary"]["trend"] = "declining"
-                else:
-                    trends["summary"]["trend"] = "stable"
-
-                # Calculate percentage change
-                if last_quarter > 0:
-                    change = ((first_quarter - last_quarter) / last_quarter) * 100
-                    trends["summary"]["change_percent"] = round(change, 1)
+        trends["summary"]["current"] = stats.current
+        trends["summary"]["average"] = stats.average
+
+        # Simple trend analysis (compare first and last quarters)
+        if stats.count >= 4:
+            first_quarter = stats.oldest_average
+            last_quarter = stats.newest_average
+
+            if first_quarter < last_quarter * 0.9:
+                trends["summary"]["trend"] = "improving"
+            elif first_quarter > last_quarter * 1.1:
+                trends["summary"]["trend"] = "declining"
+            else:
+                trends["summary"]["trend"] = "stable"
+
+            # Calculate percentage change
+            if last_quarter > 0:
+                change = ((first_quarter - last_quarter) / last_quarter) * 100
+                trends["summary"]["change_percent"] = round(change, 1)
 
         return trends
 
@@ -264,9 +804,9 @@ class AuditHistoryManager:
     ) -> ComparisonResult:
         """Compare current audit with a baseline."""
         try:
-            with open(baseline_path, "r", encoding="utf-8") as f:
-                baseline = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            st = os.stat(baseline_path)
+            baseline = _load_baseline(baseline_path, st.st_mtime_ns, st.st_size)
+        except (FileNotFoundError, ValueError):
             # Return error as a special case - we'll need to handle this differently
             raise ValueError(f"Could not load baseline from {baseline_path}")
 
@@ -278,22 +818,12 @@ class AuditHistoryManager:
                 "file": baseline_path,
                 "timestamp": baseline.get("metadata", {}).get("saved_at", "unknown"),
                 "total_findings": baseline.get("audit_info", {}).get("total_findings", 0),
-                "summary": {
-                    "critical": baseline_summary.get("critical", 0),
-                    "high": baseline_summary.get("high", 0),
-                    "medium": baseline_summary.get("medium", 0),
-                    "low": baseline_summary.get("low", 0),
-                },
+                "summary": _severity_counts(baseline_summary),
             },
             "current": {
                 "timestamp": current_report.get("audit_info", {}).get("timestamp", "unknown"),
                 "total_findings": current_report.get("audit_info", {}).get("total_findings", 0),
-                "summary": {
-                    "critical": current_summary.get("critical", 0),
-                    "high": current_summary.get("high", 0),
-                    "medium": current_summary.get("medium", 0),
-                    "low": current_summary.get("low", 0),
-                },
+                "summary": _severity_counts(current_summary),
             },
             "changes": {
                 "total_findings": 0,
@@ -308,12 +838,11 @@ class AuditHistoryManager:
         comparison["changes"]["total_findings"] = current_total - baseline_total
 
         # Calculate severity changes
-        for severity in ["critical", "high", "medium", "low"]:
-            baseline_count = comparison["baseline"]["summary"].get(severity, 0)
-            current_count = comparison["current"]["summary"].get(severity, 0)
-            comparison["changes"]["by_severity"][severity] = (
-                current_count - baseline_count
-            )
+        baseline_counts = comparison["baseline"]["summary"]
+        current_counts = comparison["current"]["summary"]
+        comparison["changes"]["by_severity"] = {
+            k: current_counts[k] - baseline_counts[k] for k in _SEVERITIES
+        }
 
         # Determine overall status
         critical_change = comparison["changes"]["by_severity"].get("critical", 0)
@@ -329,9 +858,77 @@ class AuditHistoryManager:
         return comparison
 
 
+# Severity markers for the history listing, most severe first
+_SEVERITY_EMOJI = (
+    ("critical", "🔴"),
+    ("high", "🟠"),
+    ("medium", "🟡"),
+    ("low", "🔵"),
+)
+
+_KB = 1024
+_MB = _KB * _KB
+
+
+def _format_size(size: int) -> str:
+    """Human-readable report file size."""
+    if size < _KB:
+        return f"{size}B"
+    if size < _MB:
+        return f"{size/_KB:.1f}KB"
+    return f"{size/_MB:.1f}MB"
+
+
+@lru_cache(maxsize=4)
+def get_history_manager(history_dir: str = "audit_history") -> AuditHistoryManager:
+    """
+    Shared AuditHistoryManager per history directory, so repeated commands in
+    one process reuse its directory setup and index connection.
+    """
+    return AuditHistoryManager(history_dir)
+
+
+def _render_trend(
+    trend_data: TrendData, metric: str, days: int, audit_type: Optional[str] = None
+) -> str:
+    """Render a trend analysis with its ASCII chart as one block of text."""
+    summary = trend_data["summary"]
+    trend_emoji = {"improving": "📈", "declining": "📉", "stable": "➡️"}[
+        summary["trend"]
+    ]
+
+    lines = [f"📈 Audit Trend Analysis - {metric} (last {days} days)"]
+    if audit_type:
+        lines.append(f"   Filtered by type: {audit_type}")
+    lines.append("=" * 60)
+
+    lines.append(f"Current Value: {summary['current']}")
+    lines.append(f"Average: {summary['average']:.1f}")
+    lines.append(f"Trend: {trend_emoji} {summary['trend'].title()}")
+
+    if summary["change_percent"] != 0:
+        change_emoji = "📈" if summary["change_percent"] < 0 else "📉"
+        lines.append(f"Change: {change_emoji} {summary['change_percent']:+.1f}%")
+
+    lines.append(f"\nData Points: {len(trend_data['data_points'])}")
+
+    # Simple ASCII chart for recent data points
+    if trend_data["data_points"]:
+        lines.append("\nRecent Trend:")
+        recent_points = trend_data["data_points"][-10:]  # Last 10 points
+        lines.extend(
+            f"  {point['date']}: {'█' * min(20, max(1, point['value']))}"
+            f" ({point['value']})"
+            for point in recent_points
+        )
+
+    lines.append("")
+    return "\n".join(lines)
+
+
 def handle_audit_history_command(args: Any) -> None:
     """Handle audit history subcommands (Phase 4 preview)."""
-    history_manager = AuditHistoryManager()
+    history_manager = get_history_manager()
 
     if hasattr(args, "history_action"):
         if args.history_action == "list":
@@ -353,14 +950,7 @@ def handle_audit_history_command(args: Any) -> None:
                 findings = report["total_findings"]
                 audit_type = report["audit_type"]
 
-                # Size formatting
-                size = report["file_size"]
-                if size < 1024:
-                    size_str = f"{size}B"
-                elif size < 1024 * 1024:
-                    size_str = f"{size/1024:.1f}KB"
-                else:
-                    size_str = f"{size/(1024*1024):.1f}MB"
+                size_str = _format_size(report["file_size"])
 
                 print(
                     f"{i:2d}. {timestamp} | {audit_type:12s} | {findings:2d} findings | {size_str}"
@@ -368,16 +958,11 @@ def handle_audit_history_command(args: Any) -> None:
 
                 # Show severity breakdown
                 summary = report["summary"]
-                severity_parts: List[str] = []
-                for sev, emoji in [
-                    ("critical", "🔴"),
-                    ("high", "🟠"),
-                    ("medium", "🟡"),
-                    ("low", "🔵"),
-                ]:
-                    count = summary.get(sev, 0)
-                    if count > 0:
-                        severity_parts.append(f"{emoji}{count}")
+                severity_parts = [
+                    f"{emoji}{summary[sev]}"
+                    for sev, emoji in _SEVERITY_EMOJI
+                    if summary.get(sev, 0) > 0
+                ]
 
                 if severity_parts:
                     print(f"     Severity: {' '.join(severity_parts)}")
@@ -388,33 +973,7 @@ def handle_audit_history_command(args: Any) -> None:
             days = getattr(args, "days", 30)
 
             trend_data = history_manager.get_audit_trend(days=days, metric=metric)
-
-            print(f"📈 Audit Trend Analysis - {metric} (last {days} days)")
-            print("=" * 60)
-
-            summary = trend_data["summary"]
-            trend_emoji = {"improving": "📈", "declining": "📉", "stable": "➡️"}[
-                summary["trend"]
-            ]
-
-            print(f"Current Value: {summary['current']}")
-            print(f"Average: {summary['average']:.1f}")
-            print(f"Trend: {trend_emoji} {summary['trend'].title()}")
-
-            if summary["change_percent"] != 0:
-                change_emoji = "📈" if summary["change_percent"] < 0 else "📉"
-                print(f"Change: {change_emoji} {summary['change_percent']:+.1f}%")
-
-            print(f"\nData Points: {len(trend_data['data_points'])}")
-
-            # Simple ASCII chart for recent data points
-            if trend_data["data_points"]:
-                print("\nRecent Trend:")
-                recent_points = trend_data["data_points"][-10:]  # Last 10 points
-                for point in recent_points:
-                    bar_length = min(20, max(1, point["value"]))
-                    bar = "█" * bar_length
-                    print(f"  {point['date']}: {bar} ({point['value']})")
+            sys.stdout.write(_render_trend(trend_data, metric, days))
 
     else:
         print("📝 Audit History Commands:")
@@ -429,41 +988,11 @@ def handle_audit_history_command(args: Any) -> None:
 
 def handle_audit_trends_command(args: Any) -> None:
     """Handle audit trends subcommand (Phase 4 preview)."""
-    history_manager = AuditHistoryManager()
+    history_manager = get_history_manager()
     
     metric = getattr(args, "metric", "total_findings")
     days = getattr(args, "days", 30)
     audit_type = getattr(args, "type", None)
 
     trend_data = history_manager.get_audit_trend(days=days, metric=metric)
-
-    print(f"📈 Audit Trend Analysis - {metric} (last {days} days)")
-    if audit_type:
-        print(f"   Filtered by type: {audit_type}")
-    print("=" * 60)
-
-    summary = trend_data["summary"]
-    trend_emoji = {"improving": "📈", "declining": "📉", "stable": "➡️"}[
-        summary["trend"]
-    ]
-
-    print(f"Current Value: {summary['current']}")
-    print(f"Average: {summary['average']:.1f}")
-    print(f"Trend: {trend_emoji} {summary['trend'].title()}")
-
-    if summary["change_percent"] != 0:
-        change_emoji = "📈" if summary["change_percent"] < 0 else "📉"
-        print(f"Change: {change_emoji} {summary['change_percent']:+.1f}%")
-
-    print(f"\nData Points: {len(trend_data['data_points'])}")
-
-    # Simple ASCII chart for recent data points
-    if trend_data["data_points"]:
-        print("\nRecent Trend:")
-        recent_points = trend_data["data_points"][-10:]  # Last 10 points
-        for point in recent_points:
-            bar_length = min(20, max(1, point["value"]))
-            bar = "█" * bar_length
-            print(f"  {point['date']}: {bar} ({point['value']})")
-
-
+    sys.stdout.write(_render_trend(trend_data, metric, days, audit_type))
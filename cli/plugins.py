@@ -5,23 +5,56 @@ Manages plugin installation, loading, and execution.
 """
 
 import argparse
-import json
 import os
 import sys
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+from cli.serialization import dumps_json, write_json
 
 # Add plugins directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from plugins.base import PluginFinding, PluginSeverity
+from plugins.base import AuditPlugin, PluginFinding, PluginSeverity
 from plugins.registry import PluginRegistry
 
 
+# Severity values, most severe first, mapped to PluginSeverity.rank
+_SEVERITY_NAME_RANK = {severity.value: severity.rank for severity in PluginSeverity}
+
+
+# Marker shown next to each finding in text reports
+_SEVERITY_EMOJI = {
+    "critical": "🔴",
+    "high": "🟠",
+    "medium": "🟡",
+    "low": "🔵",
+    "info": "ℹ️",
+}
+
+# (summary key, marker, label) per severity, most severe first
+_SUMMARY_ROWS = tuple(
+    (severity.value, _SEVERITY_EMOJI[severity.value], severity.name.title())
+    for severity in PluginSeverity
+)
+
+
+@lru_cache(maxsize=None)
+def get_registry(plugins_dir: str = "plugins") -> PluginRegistry:
+    """
+    Shared PluginRegistry per plugins directory. Reusing it across commands
+    skips re-reading the registry file, and plugins it has already loaded
+    are kept as instances.
+    """
+    return PluginRegistry(plugins_dir)
+
+
 class PluginAuditEngine:
     """Enhanced audit engine with plugin support."""
 
     def __init__(self, plugins_dir: str = "plugins"):
-        self.registry = PluginRegistry(plugins_dir)
+        self.registry = get_registry(plugins_dir)
         self.plugins_dir = plugins_dir
 
     def run_framework_audit(
@@ -53,81 +86,129 @@ class PluginAuditEngine:
 
         all_findings: List[PluginFinding] = []
 
-        # Get active plugins
+        # Pick candidate plugins from registry metadata; only candidates that
+        # pass the control filter are imported
+        candidates: List[Tuple[str, List[str]]]
         if frameworks:
-            active_plugins: List[Any] = []
-            for framework in frameworks:
-                try:
-                    plugin = self.registry.load_plugin(framework)
-                    if plugin:
-                        active_plugins.append(plugin)
-                except Exception as e:
-                    print(f"⚠️ Could not load plugin '{framework}': {e}")
+            registered = self.registry.registry_data["plugins"]
+            candidates = [
+                (
+                    framework,
+                    registered.get(framework.lower().replace(" ", "-"), {}).get(
+                        "controls", []
+                    ),
+                )
+                # A framework named twice would run the same plugin instance twice
+                for framework in dict.fromkeys(frameworks)
+            ]
         else:
-            # Load all enabled plugins
-            active_plugins: List[Any] = []
-            plugin_list = self.registry.list_plugins(enabled_only=True)
-            for plugin_info in plugin_list:
-                try:
-                    plugin = self.registry.load_plugin(plugin_info["framework"])
-                    if plugin:
-                        active_plugins.append(plugin)
-                except Exception as e:
-                    print(f"⚠️ Could not load plugin '{plugin_info['framework']}': {e}")
-
-        # Run each plugin
-        for plugin in active_plugins:
-            try:
-                print(f"🔍 Running {plugin.metadata.name} audit...")
-
-                # Pre-audit setup
-                if not plugin.pre_audit_setup(workspace_path, config):
-                    print(f"⚠️ Pre-audit setup failed for {plugin.metadata.name}")
-                    continue
-
-                # Run audit
-                findings = plugin.audit(config)
-
-                # Filter by controls if specified
-                if controls:
-                    findings = [f for f in findings if f.control in controls]
-
-                # Filter by severity if specified
-                if severity_filter:
-                    findings = self._filter_by_severity(findings, severity_filter)
-
-                all_findings.extend(findings)
-
-                # Post-audit cleanup
-                plugin.post_audit_cleanup(workspace_path, config)
+            # All enabled plugins
+            candidates = [
+                (plugin_info["framework"], plugin_info["controls"])
+                for plugin_info in self.registry.list_plugins(enabled_only=True)
+            ]
+
+        # Hashed once so the per-finding control filter is an O(1) lookup
+        requested_controls = frozenset(controls) if controls else None
+        # Resolved once; 0 (info) keeps every finding
+        min_level = (
+            _SEVERITY_NAME_RANK.get(severity_filter.lower(), 0)
+            if severity_filter
+            else 0
+        )
 
-                print(f"✅ {plugin.metadata.name}: {len(findings)} findings")
+        # Load each candidate plugin
+        plugins: List[AuditPlugin] = []
+        for framework, plugin_controls in candidates:
+            # Skip plugins whose registered controls cannot match the filter.
+            # Plugins that do not declare their controls are always run.
+            if (
+                requested_controls
+                and plugin_controls
+                and requested_controls.isdisjoint(plugin_controls)
+            ):
+                continue
 
+            try:
+                plugin = self.registry.load_plugin(framework)
             except Exception as e:
-                print(f"❌ Plugin {plugin.metadata.name} failed: {e}")
+                print(f"⚠️ Could not load plugin '{framework}': {e}")
+                continue
+            if plugin:
+                plugins.append(plugin)
+
+        # Plugins scan the workspace independently, so run them concurrently
+        # and collect the results in submission order to keep reports stable
+        if plugins:
+            with ThreadPoolExecutor(max_workers=min(len(plugins), 8)) as executor:
+                futures = [
+                    executor.submit(
+                        self._run_plugin,
+                        plugin,
+                        workspace_path,
+                        config,
+                        requested_controls,
+                        min_level,
+                    )
+                    for plugin in plugins
+                ]
+                for future in futures:
+                    all_findings.extend(future.result())
 
         return all_findings
 
-    def _filter_by_severity(
-        self, findings: List[PluginFinding], min_severity: str
+    def _run_plugin(
+        self,
+        plugin: AuditPlugin,
+        workspace_path: str,
+        config: Dict[str, Any],
+        requested_controls: Optional[FrozenSet[str]],
+        min_level: int,
     ) -> List[PluginFinding]:
-        """Filter findings by minimum severity level."""
-        severity_order = {"info": 0, "low": 1, "medium": 2, "high": 3, "critical": 4}
+        """Run one plugin's audit and return its filtered findings."""
+        try:
+            print(f"🔍 Running {plugin.metadata.name} audit...")
+
+            # Pre-audit setup
+            if not plugin.pre_audit_setup(workspace_path, config):
+                print(f"⚠️ Pre-audit setup failed for {plugin.metadata.name}")
+                return []
+
+            # Run audit
+            findings = plugin.audit(config)
+
+            # Filter by controls and severity if specified; the filters are
+            # chained lazily so only the final list is built
+            selected: Iterable[PluginFinding] = findings
+            if requested_controls:
+                selected = (f for f in selected if f.control in requested_controls)
+            if min_level > 0:
+                selected = self._filter_by_severity(selected, min_level)
+            if selected is not findings:
+                findings = list(selected)
+
+            # Post-audit cleanup
+            plugin.post_audit_cleanup(workspace_path, config)
+
+            print(f"✅ {plugin.metadata.name}: {len(findings)} findings")
+            return findings
+
+        except Exception as e:
+            print(f"❌ Plugin {plugin.metadata.name} failed: {e}")
+            return []
 
-        min_level = severity_order.get(min_severity.lower(), 0)
-
-        return [
-            f
-            for f in findings
-            if severity_order.get(f.severity.value.lower(), 0) >= min_level
-        ]
+    def _filter_by_severity(
+        self, findings: Iterable[PluginFinding], min_level: int
+    ) -> Iterator[PluginFinding]:
+        """Lazily keep findings ranked at or above min_level."""
+        return (f for f in findings if f.severity.rank >= min_level)
 
 
 def handle_plugins_command(args: argparse.Namespace) -> None:
     """Handle the plugins subcommand."""
-    registry = PluginRegistry()
+    registry = get_registry()
 
-    if not hasattr(args, "plugin_action") or args.plugin_action is None:
+    if args.plugin_action is None:
         args.plugin_action = "list"  # Default to list
 
     if args.plugin_action == "list":
@@ -149,13 +230,14 @@ def handle_plugins_command(args: argparse.Namespace) -> None:
 
 def handle_plugins_list(args: argparse.Namespace, registry: PluginRegistry) -> None:
     """List all plugins."""
-    print("🔌 Plugin Registry")
-    print("=" * 40)
+    lines = ["🔌 Plugin Registry", "=" * 40]
+    append = lines.append
 
     plugins = registry.list_plugins()
 
     if not plugins:
-        print("📭 No plugins registered")
+        append("📭 No plugins registered")
+        sys.stdout.write("\n".join(lines) + "\n")
         return
 
     # Group by category
@@ -167,15 +249,18 @@ def handle_plugins_list(args: argparse.Namespace, registry: PluginRegistry) -> N
         by_category[category].append(plugin)
 
     for category, category_plugins in by_category.items():
-        print(f"\n📁 {category.title()} Plugins:")
+        append(f"\n📁 {category.title()} Plugins:")
         for plugin in category_plugins:
             status = "🟢" if plugin["enabled"] else "🔴"
-            print(f"  {status} {plugin['name']} v{plugin['version']}")
-            print(f"     Framework: {plugin['framework']}")
-            print(f"     Controls: {', '.join(plugin['controls'][:5])}")  # Show first 5
+            append(f"  {status} {plugin['name']} v{plugin['version']}")
+            append(f"     Framework: {plugin['framework']}")
+            append(f"     Controls: {', '.join(plugin['controls'][:5])}")  # First 5
             if len(plugin["controls"]) > 5:
-                print(f"               ... and {len(plugin['controls']) - 5} more")
-            print()
+                append(f"               ... and {len(plugin['controls']) - 5} more")
+            append("")
+
+    # Emit the listing with a single write
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def handle_plugins_install(args: argparse.Namespace, registry: PluginRegistry) -> None:
@@ -186,7 +271,7 @@ def handle_plugins_install(args: argparse.Namespace, registry: PluginRegistry) -
 
     print(f"📦 Installing plugin from {args.plugin_path}")
 
-    category = getattr(args, "category", "custom")
+    category = args.category
     if registry.register_plugin(args.plugin_path, category):
         print("✅ Plugin installed successfully")
     else:
@@ -220,19 +305,24 @@ def handle_plugins_validate(args: argparse.Namespace, registry: PluginRegistry)
 
     valid_count = 0
     invalid_count = 0
+    lines: List[str] = []
+    append = lines.append
 
     for plugin_name, is_valid in results.items():
         if is_valid:
-            print(f"✅ {plugin_name}")
+            append(f"✅ {plugin_name}")
             valid_count += 1
         else:
-            print(f"❌ {plugin_name}")
+            append(f"❌ {plugin_name}")
             invalid_count += 1
 
-    print()
-    print(f"📊 Validation Summary:")
-    print(f"   ✅ Valid: {valid_count}")
-    print(f"   ❌ Invalid: {invalid_count}")
+    append("")
+    append("📊 Validation Summary:")
+    append(f"   ✅ Valid: {valid_count}")
+    append(f"   ❌ Invalid: {invalid_count}")
+
+    # Emit the results with a single write
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def handle_plugins_register(args: argparse.Namespace, registry: PluginRegistry) -> None:
@@ -255,12 +345,12 @@ def handle_framework_audit_command(args: argparse.Namespace) -> None:
 
     # Parse frameworks
     frameworks: Optional[List[str]] = None
-    if hasattr(args, "framework") and args.framework:
+    if args.framework:
         frameworks = [f.strip() for f in args.framework.split(",")]
 
     # Parse controls
     controls: Optional[List[str]] = None
-    if hasattr(args, "control") and args.control:
+    if args.control:
         controls = [c.strip() for c in args.control.split(",")]
 
     # Run audit
@@ -269,10 +359,20 @@ def handle_framework_audit_command(args: argparse.Namespace) -> None:
             workspace_path=".",
             frameworks=frameworks,
             controls=controls,
-            severity_filter=getattr(args, "severity", None),
+            severity_filter=args.severity,
             config={},
         )
 
+        # Serialize the findings and count them per severity in one pass.
+        # Counts are keyed by severity value, most severe first.
+        summary = dict.fromkeys(_SEVERITY_NAME_RANK, 0)
+        serialized: List[Dict[str, Any]] = []
+        append = serialized.append
+        for finding in findings:
+            record = finding.to_dict()
+            summary[record["severity"]] += 1
+            append(record)
+
         # Generate report
         audit_report: Dict[str, Any] = {
             "audit_info": {
@@ -281,34 +381,27 @@ def handle_framework_audit_command(args: argparse.Namespace) -> None:
                 "controls": controls or ["all"],
                 "total_findings": len(findings),
             },
-            "summary": {
-                "critical": len(
-                    [f for f in findings if f.severity == PluginSeverity.CRITICAL]
-                ),
-                "high": len([f for f in findings if f.severity == PluginSeverity.HIGH]),
-                "medium": len(
-                    [f for f in findings if f.severity == PluginSeverity.MEDIUM]
-                ),
-                "low": len([f for f in findings if f.severity == PluginSeverity.LOW]),
-                "info": len([f for f in findings if f.severity == PluginSeverity.INFO]),
-            },
-            "findings": [f.to_dict() for f in findings],
+            "summary": summary,
+            "findings": serialized,
         }
 
         # Output results
-        output_format = getattr(args, "output", "text")
-        if output_format == "json":
-            output = json.dumps(audit_report, indent=2)
-        else:
-            output = format_framework_audit_text(audit_report)
+        output_format = args.output
+        save_path = args.save
 
         # Save to file if requested
-        if hasattr(args, "save") and args.save:
-            with open(args.save, "w", encoding="utf-8") as f:
-                f.write(output)
-            print(f"📁 Framework audit report saved to {args.save}")
+        if save_path:
+            if output_format == "json":
+                # Serialize straight to the file without an intermediate string
+                write_json(audit_report, save_path)
+            else:
+                with open(save_path, "w", encoding="utf-8") as f:
+                    f.write(format_framework_audit_text(audit_report))
+            print(f"📁 Framework audit report saved to {save_path}")
+        elif output_format == "json":
+            print(dumps_json(audit_report))
         else:
-            print(output)
+            print(format_framework_audit_text(audit_report))
 
     except Exception as e:
         print(f"❌ Framework audit failed: {e}")
@@ -317,52 +410,42 @@ def handle_framework_audit_command(args: argparse.Namespace) -> None:
 def format_framework_audit_text(audit_report: Dict[str, Any]) -> str:
     """Format framework audit results as text."""
     lines: List[str] = []
+    append = lines.append
 
     # Summary
     summary = audit_report["summary"]
     total = audit_report["audit_info"]["total_findings"]
 
-    lines.append(f"📊 Framework Audit Summary ({total} findings)")
-    lines.append("-" * 40)
+    append(f"📊 Framework Audit Summary ({total} findings)")
+    append("-" * 40)
 
-    if summary["critical"] > 0:
-        lines.append(f"🔴 Critical: {summary['critical']}")
-    if summary["high"] > 0:
-        lines.append(f"🟠 High: {summary['high']}")
-    if summary["medium"] > 0:
-        lines.append(f"🟡 Medium: {summary['medium']}")
-    if summary["low"] > 0:
-        lines.append(f"🔵 Low: {summary['low']}")
-    if summary["info"] > 0:
-        lines.append(f"ℹ️ Info: {summary['info']}")
+    for key, emoji, label in _SUMMARY_ROWS:
+        count = summary[key]
+        if count > 0:
+            append(f"{emoji} {label}: {count}")
 
     # Detailed findings
     if audit_report["findings"]:
-        lines.append("")
-        lines.append("🔍 Framework Findings")
-        lines.append("=" * 40)
+        append("")
+        append("🔍 Framework Findings")
+        append("=" * 40)
 
+        emoji_for = _SEVERITY_EMOJI.get
         for i, finding in enumerate(audit_report["findings"], 1):
-            severity_emoji = {
-                "critical": "🔴",
-                "high": "🟠",
-                "medium": "🟡",
-                "low": "🔵",
-                "info": "ℹ️",
-            }.get(finding["severity"], "❓")
-
-            lines.append(
+            severity_emoji = emoji_for(finding["severity"], "❓")
+
+            append(
                 f"{i}. {severity_emoji} {finding['title']} ({finding['severity'].upper()})"
             )
-            lines.append(
+            append(
                 f"   Framework: {finding['framework']} | Control: {finding['control']}"
             )
-            lines.append(f"   Category: {finding['category']}")
-            lines.append(f"   Description: {finding['description']}")
+            append(f"   Category: {finding['category']}")
+            append(f"   Description: {finding['description']}")
             if finding.get("file_path"):
-                lines.append(f"   File: {finding['file_path']}")
-            lines.append(f"   💡 Remediation: {finding['remediation']}")
-            lines.append("")
+                append(f"   File: {finding['file_path']}")
+            append(f"   💡 Remediation: {finding['remediation']}")
+            append("")
 
     return "\n".join(lines)
 
@@ -374,7 +457,7 @@ def demo_plugin_system():
     print("=" * 40)
 
     # Initialize registry
-    registry = PluginRegistry()
+    registry = get_registry()
 
     # Register built-in plugins
     print("📦 Registering NIST 800-53 plugin...")
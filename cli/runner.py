@@ -4,21 +4,34 @@ CLI runner for PepeluGPT - handles mode resolution, config loading, and orchestr
 """
 
 import argparse
+import copy
+import os
 import sys
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 from cli.utils import display_banner, interactive_mode_selection
-from core.logging_config import log_error, setup_enhanced_logging
-from core.orchestrator import Orchestrator
+
+
+# Parsed configs keyed on (absolute path, mtime_ns, size)
+_CONFIG_CACHE: Dict[Tuple[str, int, int], Any] = {}
 
 
 def load_config(config_path: str) -> Dict[str, Any]:
-    """Load configuration from YAML file."""
+    """
+    Load configuration from YAML file. Parsed files are cached per process
+    until they change on disk; callers get their own copy.
+    """
     try:
-        import yaml
-
-        with open(config_path, "r") as f:
-            return yaml.safe_load(f)
+        st = os.stat(config_path)
+        key = (os.path.abspath(config_path), st.st_mtime_ns, st.st_size)
+        if key not in _CONFIG_CACHE:
+            import yaml
+
+            # The libyaml-backed loader is much faster when PyYAML has it
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            with open(config_path, "r") as f:
+                _CONFIG_CACHE[key] = yaml.load(f, Loader=loader)
+        return copy.deepcopy(_CONFIG_CACHE[key])
     except Exception as e:
         print(f"🔴 Failed to load config from {config_path}: {e}")
         return {}
@@ -26,8 +39,8 @@ def load_config(config_path: str) -> Dict[str, Any]:
 
 def resolve_mode(args: argparse.Namespace) -> str:
     """Resolve the mode to use - either from args or interactive selection."""
-    # Check if mode is set (only available for chat command)
-    mode = getattr(args, "mode", None)
+    # Mode is only set by the chat command; the parser defaults it to None
+    mode = args.mode
     if mode:
         print(f"� Mode override: {mode}")
         return mode
@@ -94,7 +107,7 @@ def run_cli(args: argparse.Namespace):
 
         if args.audit_action == "run" or args.audit_action is None:
             # Check if framework-specific audit requested
-            if hasattr(args, "framework") and args.framework:
+            if args.framework:
                 from cli.plugins import handle_framework_audit_command
 
                 handle_framework_audit_command(args)
@@ -125,7 +138,11 @@ def run_cli(args: argparse.Namespace):
         print(f"❌ Unknown command: {args.command}")
         sys.exit(1)
 
-    # Chat command logic (original main functionality)
+    # Chat command logic (original main functionality). The orchestrator and
+    # logging stack are only imported here so other subcommands start fast.
+    from core.logging_config import log_error, setup_enhanced_logging
+    from core.orchestrator import Orchestrator
+
     try:
         display_banner()
         print("🔵 Initializing PepeluGPT...")
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+JSON serialization helpers for PepeluGPT CLI reports.
+
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Union
+
+try:
+    import orjson  # type: ignore
+
+    has_orjson = True
+except ImportError:
+    orjson = None  # type: ignore
+    has_orjson = False
+
+# Make it available as a module constant
+HAS_ORJSON: bool = has_orjson
+
+if HAS_ORJSON:
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# Files at least this large are parsed from a memory map rather than a copy
+MMAP_THRESHOLD = 64 * 1024
+
+
+def dumps_json(obj: Any) -> str:
+    """Serialize obj to an indented JSON string."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode("utf-8")
+    return json.dumps(obj, indent=2)
+
+
+def _dumps_bytes(obj: Any) -> bytes:
+    """Serialize obj to indented JSON bytes."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def write_json_merged(
+    head: Dict[str, Any], body: Dict[str, Any], path: Union[str, Path]
+) -> None:
+    """
+    Write one indented JSON object holding head's keys followed by body's,
+    without building a merged dict. The two serialized objects are spliced
+    at their braces, so the keys must not overlap.
+    """
+    head_bytes = _dumps_bytes(head)
+    body_bytes = _dumps_bytes(body)
+    if not body:
+        data = head_bytes
+    elif not head:
+        data = body_bytes
+    else:
+        # '{\n  "a": 1\n}' + '{\n  "b": 2\n}' -> '{\n  "a": 1,\n  "b": 2\n}'
+        data = head_bytes[:-2] + b",\n" + body_bytes[2:]
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def write_json(obj: Any, path: Union[str, Path]) -> None:
+    """Serialize obj as indented JSON directly into the file at path."""
+    if HAS_ORJSON:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=_ORJSON_OPTIONS))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(obj, f, indent=2)
+
+
+# Parse JSON from bytes or str; bound once so callers pay no per-call branch
+loads_json: Callable[[Union[bytes, str]], Any] = (
+    orjson.loads if HAS_ORJSON else json.loads
+)
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """
+    Parse the JSON file at path. With orjson, large files are parsed straight
+    from a read-only memory map instead of being copied into a bytes object.
+    """
+    with open(path, "rb") as f:
+        if HAS_ORJSON and os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        return loads_json(f.read())
@@ -48,6 +48,28 @@ class TestCLIArgs(unittest.TestCase):
             args = parse_args()
             self.assertTrue(args.debug)
 
+    def test_explicit_argv(self):
+        """Test repeated programmatic parsing with explicit argv."""
+        args = parse_args(["status", "--json"])
+        self.assertEqual(args.command, "status")
+        self.assertTrue(args.json)
+
+        args = parse_args([])
+        self.assertEqual(args.command, "chat")
+        self.assertFalse(args.preload_data)
+
+    def test_bare_audit_defaults(self):
+        """Test that a bare audit command carries the run defaults."""
+        args = parse_args(["audit"])
+        self.assertIsNone(args.audit_action)
+        self.assertEqual(args.type, "all")
+        self.assertEqual(args.output, "text")
+        self.assertIsNone(args.framework)
+
+        # Subcommand defaults still win over the audit-level ones
+        args = parse_args(["audit", "history"])
+        self.assertIsNone(args.type)
+
 
 class TestCLIUtils(unittest.TestCase):
     """Test CLI utility functions."""
@@ -85,8 +107,8 @@ class TestCLIUtils(unittest.TestCase):
 class TestCLIRunner(unittest.TestCase):
     """Test CLI runner functionality (mock-based tests)."""
 
-    @patch("cli.runner.setup_enhanced_logging")
-    @patch("cli.runner.Orchestrator")
+    @patch("core.logging_config.setup_enhanced_logging")
+    @patch("core.orchestrator.Orchestrator")
     @patch("cli.runner.load_config")
     def test_run_cli_with_mode_override(
         self, mock_load_config: MagicMock, mock_orchestrator: MagicMock, mock_logging: MagicMock
@@ -14,6 +14,16 @@ BANNER = r"""
 
 """
 
+# Accepted answers for the interactive mode prompt, mapped to the mode name
+MODE_CHOICES = {
+    "adaptive": "adaptive",
+    "adapt": "adaptive",
+    "a": "adaptive",
+    "classic": "classic",
+    "class": "classic",
+    "c": "classic",
+}
+
 
 def display_banner():
     """Display the PepeluGPT banner."""
@@ -29,14 +39,10 @@ def interactive_mode_selection() -> str:
 
     while True:
         choice = input("Enter 'adaptive' or 'classic': ").strip().lower()
-        if choice in ["adaptive", "classic"]:
-            return choice
-        elif choice in ["a", "adapt"]:
-            return "adaptive"
-        elif choice in ["c", "class"]:
-            return "classic"
-        else:
-            print("🟡 Please enter 'adaptive' or 'classic'")
+        mode = MODE_CHOICES.get(choice)
+        if mode:
+            return mode
+        print("🟡 Please enter 'adaptive' or 'classic'")
 
 
 def get_mode_display_name(internal_mode: str) -> str:
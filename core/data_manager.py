@@ -5,15 +5,174 @@ Implements hash-based validation, lazy initialization, and persistent storage.
 
 import hashlib
 import json
+import mmap
+import os
 import pickle
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import closing
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import zstandard  # type: ignore
+
+    has_zstd = True
+except ImportError:
+    zstandard = None  # type: ignore
+    has_zstd = False
+
+try:
+    import xxhash  # type: ignore
+
+    has_xxhash = True
+except ImportError:
+    xxhash = None  # type: ignore
+    has_xxhash = False
 
 from core.utils import get_logger
 
+# Make them available as module constants
+HAS_ZSTD: bool = has_zstd
+HAS_XXHASH: bool = has_xxhash
+
 LOG = get_logger(__name__)
 
+# Leading bytes of a zstd frame; pickles start with the PROTO opcode instead
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Read size used when hashing file contents
+_HASH_CHUNK_SIZE = 1 << 20
+
+# Parsed data caches at least this large are loaded from a memory map
+_MMAP_MIN_SIZE = 64 * 1024
+
+# Fewer files than this are parsed in-process
+_PARALLEL_PARSE_MIN_FILES = 16
+
+# Bump when the hash table schema changes; older tables are rebuilt
+_HASH_SCHEMA_VERSION = 1
+
+
+def _walk_files(root: str) -> Iterator["os.DirEntry[str]"]:
+    """
+    Yield a DirEntry for every file under root. Directory entries carry their
+    file type from the directory read, so no file is stat'ed to classify it;
+    symlinked directories are not followed. Directories that cannot be read
+    are skipped.
+    """
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        try:
+            it = os.scandir(path)
+        except OSError as e:
+            LOG.debug(f"🔵 Skipping unreadable directory {path}: {e}")
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
+
+def _parse_file(parser: Any, file_path: Path) -> Dict[str, Any]:
+    """Parse one source file into its cache entry."""
+    try:
+        LOG.debug(f"🔵 Parsing file: {file_path}")
+        parsed_content = parser.parse(str(file_path))
+
+        # Convert list content to string if needed
+        if isinstance(parsed_content, list):
+            content_str = "\n\n".join(str(item) for item in parsed_content if item)
+        else:
+            content_str = str(parsed_content) if parsed_content else ""
+
+        # Only the joined text is cached; keeping the parser's original output
+        # as well would store the same text twice
+        file_stat = file_path.stat()
+        return {
+            "content": content_str,
+            "size": file_stat.st_size,
+            "modified": datetime.fromtimestamp(file_stat.st_mtime).isoformat(),
+        }
+    except Exception as e:
+        LOG.error(f"🔴 Error parsing {file_path}: {e}")
+        return {"error": str(e), "content": None}
+
+
+# Parser coordinator of a parse worker process, set by _init_parse_worker
+_worker_parser: Any = None
+
+
+def _init_parse_worker(config: Dict[str, Any]) -> None:
+    """Build the parser coordinator once per worker process."""
+    global _worker_parser
+    from processing.parse import ParserCoordinator
+
+    _worker_parser = ParserCoordinator(config)
+
+
+def _parse_in_worker(file_path: Path) -> Dict[str, Any]:
+    """Parse one file with the worker process's parser coordinator."""
+    return _parse_file(_worker_parser, file_path)
+
+
+def _content_hasher() -> Any:
+    """
+    New incremental hasher for file contents. Hashes only detect changes, so
+    the non-cryptographic xxh3 is used when installed; BLAKE2b is the fastest
+    stdlib fallback on 64-bit machines.
+    """
+    if HAS_XXHASH:
+        return xxhash.xxh3_64()
+    return hashlib.blake2b(digest_size=16)
+
+
+def _hashes_digest(hashes: Dict[str, List[Any]]) -> str:
+    """
+    Digest of the file content hashes a parse was built from. Size and mtime
+    are left out, so touched but unmodified files keep the same digest.
+    """
+    digest = _content_hasher()
+    for rel_path in sorted(hashes):
+        digest.update(f"{rel_path}\0{hashes[rel_path][2]}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _open_hash_db(db_path: Path) -> sqlite3.Connection:
+    """
+    Open the file hash database, creating or rebuilding its table as needed.
+    The table only caches file signatures, so an outdated schema is dropped.
+    """
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    (version,) = conn.execute("PRAGMA user_version").fetchone()
+    with conn:
+        if version != _HASH_SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS hashes")
+            conn.execute(f"PRAGMA user_version = {_HASH_SCHEMA_VERSION}")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS hashes (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                content_hash TEXT NOT NULL
+            )
+        """
+        )
+    return conn
+
+
+def _relative_path(root: str, path: str) -> str:
+    """Path of a _walk_files entry relative to the walked root."""
+    # Joining an empty name adds the separator unless root already ends in one
+    return path[len(os.path.join(root, "")) :]
+
 
 class DataManager:
     """
@@ -45,7 +204,7 @@ class DataManager:
         # Cache file paths
         self.parsed_data_path = self.cache_dir / "parsed_data.pkl"
         self.metadata_cache_path = self.cache_dir / "cache_metadata.json"
-        self.hash_cache_path = self.cache_dir / "data_hashes.json"
+        self.hash_cache_path = self.cache_dir / "data_hashes.sqlite"
 
         # Source data directory
         self.source_dir = Path(self.config.get("source_dir", "cyber_documents"))
@@ -81,85 +240,201 @@ class DataManager:
 
         # Strategy 3: Parse fresh data (lazy initialization)
         LOG.info("🔵 Parsing fresh data")
-        raw_data = self._load_raw_data()
-        self._parsed_data = self._parse_raw_data(raw_data)
-        self._save_parsed_data(self._parsed_data)
-        self._update_cache_metadata()
+        # Hashes are taken before parsing and stored once the parsed data is
+        # saved, so a file edited mid-parse is picked up on the next run
+        stored_hashes = self._load_stored_hashes()
+        current_hashes = self._calculate_data_hashes(stored_hashes)
+        previous_data = (
+            self._load_parsed_data() if stored_hashes is not None else None
+        )
+        # Only reuse parsed data built from exactly the stored hashes; any
+        # other cache may hold entries the diff below would never revisit
+        previous_digest = (previous_data or {}).get("metadata", {}).get(
+            "source_digest"
+        )
+        if previous_digest is not None and previous_digest == _hashes_digest(
+            stored_hashes
+        ):
+            self._parsed_data = self._reparse_changed_data(
+                previous_data, current_hashes, stored_hashes
+            )
+        else:
+            raw_data = self._load_raw_data()
+            self._parsed_data = self._parse_raw_data(raw_data)
+        metadata = self._parsed_data.setdefault("metadata", {})
+        metadata["source_digest"] = _hashes_digest(current_hashes)
+        if self._save_parsed_data(self._parsed_data):
+            self._save_data_hashes(current_hashes, stored_hashes)
+            self._update_cache_metadata()
 
         return self._parsed_data
 
     def _data_unchanged(self) -> bool:
         """
-        Check if source data has changed using hash validation.
+        Check if source data has changed using hash validation. Stops at the
+        first difference: a changed file count is detected before any file is
+        stat'ed, and files after the first changed one are not checked.
 
         Returns:
             True if data is unchanged, False otherwise
         """
         try:
-            current_hashes = self._calculate_data_hashes()
             stored_hashes = self._load_stored_hashes()
-
             if stored_hashes is None:
                 LOG.debug("🔵 No stored hashes found")
                 return False
 
-            # Compare hashes
-            if current_hashes == stored_hashes:
-                LOG.debug("🔵 Data hashes match - no changes detected")
-                return True
-            else:
-                LOG.debug("🔵 Data hashes differ - changes detected")
-                self._save_data_hashes(current_hashes)
+            if not self.source_dir.exists():
+                LOG.warning(f"🟡 Source directory not found: {self.source_dir}")
+                return False
+
+            entries = list(_walk_files(str(self.source_dir)))
+            if len(entries) != len(stored_hashes):
+                LOG.debug("🔵 Source file count differs - changes detected")
                 return False
 
+            # Compare content hashes
+            touched: Dict[str, List[Any]] = {}
+            with closing(self._iter_file_hashes(entries, stored_hashes)) as hashes:
+                for rel_path, file_hash in hashes:
+                    stored = stored_hashes.get(rel_path)
+                    if file_hash is None or stored is None:
+                        LOG.debug("🔵 Data hashes differ - changes detected")
+                        return False
+                    if file_hash[2] != stored[2]:
+                        LOG.debug("🔵 Data hashes differ - changes detected")
+                        return False
+                    if file_hash is not stored:
+                        touched[rel_path] = file_hash
+
+            LOG.debug("🔵 Data hashes match - no changes detected")
+            if touched:
+                # Touched but unmodified files: store the new size/mtime so
+                # they are not re-read next time
+                self._save_data_hashes(
+                    {**stored_hashes, **touched}, stored_hashes
+                )
+            return True
+
         except Exception as e:
             LOG.warning(f"🟡 Error checking data changes: {e}")
             return False
 
-    def _calculate_data_hashes(self) -> Dict[str, str]:
+    def _calculate_data_hashes(
+        self, stored: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, List[Any]]:
         """
-        Calculate hash for all source files.
+        Calculate hash for all source files. Files whose size and mtime match
+        their stored entry keep its content hash without being read.
+
+        Args:
+            stored: Previously stored entries, keyed by relative path
 
         Returns:
-            Dictionary mapping file paths to their hashes
+            Dictionary mapping file paths to [size, mtime_ns, content hash]
         """
-        hashes: Dict[str, str] = {}
+        hashes: Dict[str, List[Any]] = {}
 
         if not self.source_dir.exists():
             LOG.warning(f"🟡 Source directory not found: {self.source_dir}")
             return hashes
 
-        for file_path in self.source_dir.rglob("*"):
-            if file_path.is_file():
-                try:
-                    # Use file size + modification time as a faster alternative to full file hash
-                    stat = file_path.stat()
-                    # Create a simple hash from size and mtime (much faster than reading file)
-                    file_signature = f"{stat.st_size}:{stat.st_mtime}"
-                    file_hash = hashlib.md5(file_signature.encode()).hexdigest()
-                    hashes[str(file_path.relative_to(self.source_dir))] = file_hash
-                except Exception as e:
-                    LOG.warning(f"🟡 Error hashing file {file_path}: {e}")
+        entries = list(_walk_files(str(self.source_dir)))
+        with closing(self._iter_file_hashes(entries, stored or {})) as file_hashes:
+            for rel_path, file_hash in file_hashes:
+                if file_hash is not None:
+                    hashes[rel_path] = file_hash
 
         LOG.debug(f"🔵 Calculated hashes for {len(hashes)} files")
         return hashes
 
-    def _load_stored_hashes(self) -> Optional[Dict[str, str]]:
-        """Load previously stored file hashes."""
+    def _iter_file_hashes(
+        self, entries: List["os.DirEntry[str]"], stored: Dict[str, Any]
+    ) -> Iterator[Tuple[str, Optional[List[Any]]]]:
+        """
+        Yield (relative path, file hash) for each entry, in order. Stat calls
+        and reads release the GIL, so files are hashed on a thread pool to
+        overlap their latency on large trees; closing the generator early
+        cancels the files not yet started.
+        """
+        root = str(self.source_dir)
+        rel_paths = [_relative_path(root, entry.path) for entry in entries]
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            yield from zip(
+                rel_paths,
+                executor.map(
+                    self._file_hash, entries, [stored.get(rel) for rel in rel_paths]
+                ),
+            )
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _file_hash(
+        self, entry: "os.DirEntry[str]", stored: Any = None
+    ) -> Optional[List[Any]]:
+        """
+        [size, mtime_ns, content hash] for a file; returns None if the file can
+        no longer be read. The content is only hashed when size or mtime differ
+        from the stored entry.
+        """
+        try:
+            file_stat = entry.stat()
+            size, mtime_ns = file_stat.st_size, file_stat.st_mtime_ns
+            if stored is not None and stored[:2] == [size, mtime_ns]:
+                return stored
+
+            digest = _content_hasher()
+            with open(entry.path, "rb") as f:
+                for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                    digest.update(chunk)
+            return [size, mtime_ns, digest.hexdigest()]
+        except OSError:
+            return None
+
+    def _load_stored_hashes(self) -> Optional[Dict[str, List[Any]]]:
+        """Load previously stored file hashes; None if none are stored."""
         try:
             if self.hash_cache_path.exists():
-                with open(self.hash_cache_path, "r") as f:
-                    return json.load(f)
+                with closing(_open_hash_db(self.hash_cache_path)) as conn:
+                    rows = conn.execute(
+                        "SELECT path, size, mtime_ns, content_hash FROM hashes"
+                    ).fetchall()
+                if rows:
+                    return {path: list(entry) for path, *entry in rows}
         except Exception as e:
             LOG.warning(f"🟡 Error loading stored hashes: {e}")
         return None
 
-    def _save_data_hashes(self, hashes: Dict[str, str]) -> None:
-        """Save file hashes to cache."""
+    def _save_data_hashes(
+        self,
+        hashes: Dict[str, List[Any]],
+        previous: Optional[Dict[str, List[Any]]] = None,
+    ) -> None:
+        """
+        Save file hashes to cache. Only entries that differ from previous,
+        the map as last stored, are written or deleted.
+        """
+        previous = previous or {}
+        changed = [
+            (path, *entry)
+            for path, entry in hashes.items()
+            if previous.get(path) != entry
+        ]
+        removed = [(path,) for path in previous if path not in hashes]
         try:
-            with open(self.hash_cache_path, "w") as f:
-                json.dump(hashes, f, indent=2)
-            LOG.debug("🔵 Data hashes saved to cache")
+            with closing(_open_hash_db(self.hash_cache_path)) as conn, conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO hashes (path, size, mtime_ns, content_hash)"
+                    " VALUES (?, ?, ?, ?)",
+                    changed,
+                )
+                conn.executemany("DELETE FROM hashes WHERE path = ?", removed)
+            LOG.debug(
+                f"🔵 Data hashes saved to cache ({len(changed)} updated, "
+                f"{len(removed)} removed)"
+            )
         except Exception as e:
             LOG.error(f"🔴 Error saving data hashes: {e}")
 
@@ -174,10 +449,7 @@ class DataManager:
             LOG.error(f"🔴 Source directory not found: {self.source_dir}")
             return []
 
-        file_paths: List[Path] = []
-        for file_path in self.source_dir.rglob("*"):
-            if file_path.is_file():
-                file_paths.append(file_path)
+        file_paths = [Path(entry.path) for entry in _walk_files(str(self.source_dir))]
 
         LOG.info(f"🔵 Found {len(file_paths)} files to process")
         return file_paths
@@ -203,62 +475,132 @@ class DataManager:
             },
         }
 
-        # Initialize parser coordinator
-        parser_coordinator = ParserCoordinator(self.config)
-
-        for file_path in raw_data:
+        # Parsing is CPU bound, so larger batches are spread over worker
+        # processes; small ones are not worth the process start-up
+        entries: Optional[List[Dict[str, Any]]] = None
+        if len(raw_data) >= _PARALLEL_PARSE_MIN_FILES and (os.cpu_count() or 1) > 1:
             try:
-                LOG.debug(f"🔵 Parsing file: {file_path}")
-                parsed_content = parser_coordinator.parse(str(file_path))
-
-                # Convert list content to string if needed
-                if isinstance(parsed_content, list):
-                    content_str = "\n\n".join(
-                        str(item) for item in parsed_content if item
+                with ProcessPoolExecutor(
+                    initializer=_init_parse_worker, initargs=(self.config,)
+                ) as executor:
+                    entries = list(
+                        executor.map(_parse_in_worker, raw_data, chunksize=8)
                     )
-                else:
-                    content_str = str(parsed_content) if parsed_content else ""
-
-                parsed_data["files"][str(file_path.relative_to(self.source_dir))] = {
-                    "content": content_str,
-                    "raw_content": parsed_content,  # Keep original for advanced processing
-                    "size": file_path.stat().st_size,
-                    "modified": datetime.fromtimestamp(
-                        file_path.stat().st_mtime
-                    ).isoformat(),
-                }
             except Exception as e:
-                LOG.error(f"🔴 Error parsing {file_path}: {e}")
-                parsed_data["files"][str(file_path.relative_to(self.source_dir))] = {
-                    "error": str(e),
-                    "content": None,
-                }
+                LOG.warning(f"🟡 Parallel parsing failed, parsing serially: {e}")
+
+        if entries is None:
+            # Initialize parser coordinator
+            parser_coordinator = ParserCoordinator(self.config)
+            entries = [_parse_file(parser_coordinator, path) for path in raw_data]
+
+        for file_path, entry in zip(raw_data, entries):
+            parsed_data["files"][str(file_path.relative_to(self.source_dir))] = entry
 
         LOG.info(
             f"🟢 Successfully parsed {len([f for f in parsed_data['files'].values() if f.get('content')])} files"
         )
         return parsed_data
 
+    def _reparse_changed_data(
+        self,
+        previous_data: Dict[str, Any],
+        current_hashes: Dict[str, List[Any]],
+        stored_hashes: Dict[str, List[Any]],
+    ) -> Dict[str, Any]:
+        """
+        Update previously parsed data in place of a full parse. Only files
+        that were added or whose content hash changed are parsed again;
+        entries for removed files are dropped.
+
+        Args:
+            previous_data: Parsed data loaded from the persistent cache
+            current_hashes: File hashes of the source directory as it is now
+            stored_hashes: File hashes the previous data was parsed from
+
+        Returns:
+            Parsed data structure
+        """
+        files: Dict[str, Any] = previous_data["files"]
+        changed = [
+            rel_path
+            for rel_path, file_hash in current_hashes.items()
+            if rel_path not in files
+            or rel_path not in stored_hashes
+            or stored_hashes[rel_path][2] != file_hash[2]
+        ]
+        removed = [rel_path for rel_path in files if rel_path not in current_hashes]
+        LOG.info(
+            f"🔵 Re-parsing {len(changed)} changed files, "
+            f"dropping {len(removed)} removed files"
+        )
+
+        for rel_path in removed:
+            del files[rel_path]
+
+        parsed_data = self._parse_raw_data(
+            [self.source_dir / rel_path for rel_path in changed]
+        )
+        files.update(parsed_data["files"])
+        parsed_data["files"] = files
+        parsed_data["metadata"]["total_files"] = len(files)
+        return parsed_data
+
     def _load_parsed_data(self) -> Optional[Any]:
         """Load parsed data from persistent cache."""
         try:
             if self.parsed_data_path.exists():
                 with open(self.parsed_data_path, "rb") as f:
-                    data = pickle.load(f)
-                LOG.debug("🔵 Loaded parsed data from cache")
+                    # Large caches are unpickled or decompressed straight from
+                    # the page cache instead of being copied into bytes first
+                    if os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+                        with mmap.mmap(
+                            f.fileno(), 0, access=mmap.ACCESS_READ
+                        ) as mm:
+                            data = self._unpickle_parsed_data(mm)
+                    else:
+                        data = self._unpickle_parsed_data(f.read())
+                if data is not None:
+                    LOG.debug("🔵 Loaded parsed data from cache")
                 return data
         except Exception as e:
             LOG.warning(f"🟡 Error loading parsed data cache: {e}")
         return None
 
-    def _save_parsed_data(self, data: Any) -> None:
-        """Save parsed data to persistent cache."""
+    def _unpickle_parsed_data(self, payload: Any) -> Optional[Any]:
+        """Unpickle a parsed data cache payload, decompressing it if needed."""
+        if payload[:4] == _ZSTD_MAGIC:
+            if not HAS_ZSTD:
+                LOG.warning(
+                    "🟡 Parsed data cache is zstd-compressed but "
+                    "zstandard is not installed"
+                )
+                return None
+            payload = zstandard.ZstdDecompressor().decompress(payload)
+        return pickle.loads(payload)
+
+    def _save_parsed_data(self, data: Any) -> bool:
+        """
+        Save parsed data to persistent cache.
+
+        Returns:
+            True if the cache was written, False otherwise
+        """
         try:
+            payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+            if HAS_ZSTD:
+                # Parsed text compresses well; the frame records its size so
+                # loading can decompress in one call
+                payload = zstandard.ZstdCompressor(level=3, threads=-1).compress(
+                    payload
+                )
             with open(self.parsed_data_path, "wb") as f:
-                pickle.dump(data, f)
+                f.write(payload)
             LOG.debug("🔵 Saved parsed data to cache")
+            return True
         except Exception as e:
             LOG.error(f"🔴 Error saving parsed data: {e}")
+            return False
 
     def _update_cache_metadata(self) -> None:
         """Update cache metadata with current timestamp and info."""
@@ -271,8 +613,9 @@ class DataManager:
         }
 
         try:
-            with open(self.metadata_cache_path, "w") as f:
-                json.dump(metadata, f, indent=2)
+            # Only read back by get_cache_info, so it is written compactly
+            with open(self.metadata_cache_path, "w", encoding="utf-8") as f:
+                json.dump(metadata, f, separators=(",", ":"), ensure_ascii=False)
             LOG.debug("🔵 Updated cache metadata")
         except Exception as e:
             LOG.error(f"🔴 Error updating cache metadata: {e}")
@@ -282,11 +625,14 @@ class DataManager:
         self._parsed_data = None
         self._data_hash = None
 
-        # Remove cache files
+        # Remove cache files, including the hash database's WAL side files
+        hash_db = str(self.hash_cache_path)
         for cache_file in [
             self.parsed_data_path,
             self.metadata_cache_path,
             self.hash_cache_path,
+            Path(hash_db + "-wal"),
+            Path(hash_db + "-shm"),
         ]:
             try:
                 if cache_file.exists():
@@ -345,7 +691,7 @@ class DataManager:
         # Add metadata if available
         try:
             if self.metadata_cache_path.exists():
-                with open(self.metadata_cache_path, "r") as f:
+                with open(self.metadata_cache_path, "r", encoding="utf-8") as f:
                     info["cache_metadata"] = json.load(f)
         except Exception as e:
             LOG.warning(f"🟡 Error reading cache metadata: {e}")
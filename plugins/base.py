@@ -12,13 +12,24 @@ from typing import Any, Dict, List, Optional
 
 
 class PluginSeverity(Enum):
-    """Standardized severity levels for all plugins."""
+    """
+    Standardized severity levels for all plugins. Each member's value is its
+    lowercase name; ``rank`` orders members from INFO (0) to CRITICAL (4).
+    """
+
+    CRITICAL = ("critical", 4)
+    HIGH = ("high", 3)
+    MEDIUM = ("medium", 2)
+    LOW = ("low", 1)
+    INFO = ("info", 0)
+
+    rank: int
 
-    CRITICAL = "critical"
-    HIGH = "high"
-    MEDIUM = "medium"
-    LOW = "low"
-    INFO = "info"
+    def __new__(cls, value: str, rank: int) -> "PluginSeverity":
+        member = object.__new__(cls)
+        member._value_ = value
+        member.rank = rank
+        return member
 
 
 @dataclass
@@ -44,7 +55,8 @@ class PluginFinding:
             "id": self.id,
             "title": self.title,
             "description": self.description,
-            "severity": self.severity.value,
+            # _value_ is a plain attribute; .value goes through a descriptor
+            "severity": self.severity._value_,
             "category": self.category,
             "framework": self.framework,
             "control": self.control,
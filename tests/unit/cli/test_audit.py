@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the CLI security audit.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from cli.audit import AuditCache, SecurityAuditor
+
+
+@pytest.mark.unit
+class TestSecurityAuditor:
+    """Test cases for the SecurityAuditor."""
+
+    def test_file_permissions_finds_credential_files(self, tmp_path, monkeypatch):
+        """World-readable key files in known locations are reported."""
+        (tmp_path / "certs").mkdir()
+        key_file = tmp_path / "certs" / "server.key"
+        key_file.write_text("secret")
+        key_file.chmod(0o644)
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "ignored.pem").write_text("secret")
+        (tmp_path / "config").mkdir()
+        (tmp_path / "config" / ".git").mkdir()
+        (tmp_path / "config" / ".git" / "ignored.pem").write_text("secret")
+        (tmp_path / "top.pem").write_text("secret")
+        (tmp_path / "top.pem").chmod(0o644)
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "outside.key").write_text("secret")
+        monkeypatch.chdir(tmp_path)
+
+        findings = SecurityAuditor().audit_file_permissions()
+        paths = {Path(f.file_path).as_posix() for f in findings}
+
+        assert "certs/server.key" in paths
+        assert "top.pem" in paths
+        assert "config" in paths
+        assert not any(p.endswith("ignored.pem") for p in paths)
+        assert "src/outside.key" not in paths
+
+    def test_configuration_finds_nested_credentials(self, tmp_path):
+        """Hardcoded credentials are found at any depth; env references are not."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            "api:\n"
+            "  token: abc123\n"
+            "  nested:\n"
+            "    db_password: hunter2\n"
+            "    secret_ref: ${SECRET}\n"
+            "name: test\n"
+        )
+
+        findings = SecurityAuditor().audit_configuration_security(str(config_file))
+        descriptions = [
+            f.description
+            for f in findings
+            if f.title == "Hardcoded credential in config"
+        ]
+
+        assert descriptions == [
+            "Found potential credential in config at api.token",
+            "Found potential credential in config at api.nested.db_password",
+        ]
+
+    def test_configuration_findings_are_cached(self, tmp_path):
+        """Unchanged configs are served from the cache; edits invalidate it."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("logging:\n  level: DEBUG\n")
+        cache_path = tmp_path / "cache" / "audit_cache.json"
+
+        cache = AuditCache(cache_path)
+        first = SecurityAuditor("t1", cache).audit_configuration_security(
+            str(config_file)
+        )
+        cache.save()
+
+        cache = AuditCache(cache_path)
+        signature = AuditCache.signature(str(config_file))
+        cached = cache.get(f"config:{config_file}", signature, "t2")
+        assert [f.title for f in cached] == [f.title for f in first]
+        assert all(f.timestamp == "t2" for f in cached)
+
+        config_file.write_text("logging:\n  level: INFO\n  extra: value\n")
+        signature = AuditCache.signature(str(config_file))
+        assert cache.get(f"config:{config_file}", signature, "t3") is None
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Unit tests for audit history storage and listing.
+"""
+
+import datetime
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from cli import audit_history
+from cli.audit_history import AuditHistoryManager
+
+
+def make_report(total: int, critical: int = 0) -> dict:
+    """Build a minimal audit report as produced by the audit command."""
+    return {
+        "audit_info": {"timestamp": "2026-01-01T00:00:00", "total_findings": total},
+        "summary": {
+            "critical": critical,
+            "high": 0,
+            "medium": 0,
+            "low": total - critical,
+        },
+        "findings": [],
+    }
+
+
+@pytest.mark.unit
+class TestAuditHistoryManager:
+    """Test cases for the AuditHistoryManager."""
+
+    def test_save_and_list(self, tmp_path):
+        """Saved reports are listed with their summary fields."""
+        manager = AuditHistoryManager(str(tmp_path))
+        path = manager.save_audit_report(make_report(3, critical=1), "security")
+
+        reports = manager.list_audit_reports()
+
+        assert len(reports) == 1
+        assert reports[0]["file_path"] == path
+        assert reports[0]["audit_type"] == "security"
+        assert reports[0]["total_findings"] == 3
+        assert reports[0]["summary"]["critical"] == 1
+        assert reports[0]["file_size"] == Path(path).stat().st_size
+
+    def test_list_refreshes_changed_reports(self, tmp_path):
+        """Reports modified after indexing are re-read instead of served stale."""
+        manager = AuditHistoryManager(str(tmp_path))
+        path = Path(manager.save_audit_report(make_report(1), "all"))
+        assert manager.list_audit_reports()[0]["total_findings"] == 1
+
+        report = json.loads(path.read_text(encoding="utf-8"))
+        report["audit_info"]["total_findings"] = 42
+        path.write_text(json.dumps(report), encoding="utf-8")
+
+        fresh = AuditHistoryManager(str(tmp_path))
+        assert fresh.list_audit_reports()[0]["total_findings"] == 42
+
+    @pytest.mark.parametrize("has_ijson", [True, False])
+    def test_list_report_without_summary_fields(
+        self, tmp_path, monkeypatch, has_ijson
+    ):
+        """A report with no summary fields is listed with defaults either way."""
+        if has_ijson:
+            pytest.importorskip("ijson")
+        monkeypatch.setattr(audit_history, "HAS_IJSON", has_ijson)
+        month_dir = tmp_path / "2023" / "06"
+        month_dir.mkdir(parents=True)
+        (month_dir / "audit_all_20230601_000000.json").write_text("{}")
+
+        reports = AuditHistoryManager(str(tmp_path)).list_audit_reports()
+
+        assert [(r["audit_type"], r["total_findings"]) for r in reports] == [
+            ("unknown", 0)
+        ]
+
+    def test_list_filters_by_type(self, tmp_path):
+        """Only reports of the requested audit type are returned."""
+        manager = AuditHistoryManager(str(tmp_path))
+        manager.save_audit_report(make_report(1), "security")
+        manager.save_audit_report(make_report(2), "config")
+
+        reports = manager.list_audit_reports(audit_type="config")
+
+        assert [r["audit_type"] for r in reports] == ["config"]
+
+    def test_list_window_skips_old_reports(self, tmp_path):
+        """Reports saved before `since` are excluded by their path and filename."""
+        manager = AuditHistoryManager(str(tmp_path))
+        old_dir = tmp_path / "2020" / "01"
+        old_dir.mkdir(parents=True)
+        old_report = make_report(5)
+        old_report["metadata"] = {
+            "saved_at": "2020-01-01T00:00:00",
+            "audit_type": "all",
+        }
+        old_file = old_dir / "audit_all_20200101_000000.json"
+        old_file.write_text(json.dumps(old_report))
+        manager.save_audit_report(make_report(1), "all")
+
+        assert len(manager.list_audit_reports()) == 2
+        since = datetime.datetime.now() - datetime.timedelta(days=30)
+        recent = manager.list_audit_reports(since=since)
+        assert [r["total_findings"] for r in recent] == [1]
+
+    def test_list_limit_stops_at_newest(self, tmp_path):
+        """Only the newest `limit` reports are read; older corrupt ones are not."""
+        manager = AuditHistoryManager(str(tmp_path))
+        for year, total in (("2021", 1), ("2022", 2), ("2023", 3)):
+            month_dir = tmp_path / year / "06"
+            month_dir.mkdir(parents=True)
+            report = make_report(total)
+            report["metadata"] = {
+                "saved_at": f"{year}-06-01T00:00:00",
+                "audit_type": "all",
+            }
+            (month_dir / f"audit_all_{year}0601_000000.json").write_text(
+                json.dumps(report)
+            )
+        (tmp_path / "2020" / "01").mkdir(parents=True)
+        corrupt = tmp_path / "2020" / "01" / "audit_all_20200101_000000.json"
+        corrupt.write_text("{not json")
+
+        reports = manager.list_audit_reports(limit=2)
+
+        assert [r["total_findings"] for r in reports] == [3, 2]
+        assert len(manager.list_audit_reports(limit=10)) == 3
+
+    @pytest.mark.parametrize("newest", ["all", "config", "security"])
+    def test_list_limit_orders_same_second_by_saved_time(self, tmp_path, newest):
+        """Reports sharing a filename second are ranked by their saved time."""
+        manager = AuditHistoryManager(str(tmp_path))
+        month_dir = tmp_path / "2023" / "06"
+        month_dir.mkdir(parents=True)
+        for total, audit_type in enumerate(("all", "config", "security")):
+            report = make_report(total)
+            micros = 9 if audit_type == newest else total
+            report["metadata"] = {
+                "saved_at": f"2023-06-01T00:00:00.00000{micros}",
+                "audit_type": audit_type,
+            }
+            (month_dir / f"audit_{audit_type}_20230601_000000.json").write_text(
+                json.dumps(report)
+            )
+
+        reports = manager.list_audit_reports(limit=1)
+
+        assert [r["audit_type"] for r in reports] == [newest]
+
+    def test_trend_summary(self, tmp_path):
+        """Trend summary reports the newest value, the mean and the change."""
+        manager = AuditHistoryManager(str(tmp_path))
+        now = datetime.datetime.now()
+        for day, total in enumerate([8, 8, 8, 8, 2, 2, 2, 2]):
+            saved = now - datetime.timedelta(days=day, minutes=1)
+            month_dir = tmp_path / str(saved.year) / f"{saved.month:02d}"
+            month_dir.mkdir(parents=True, exist_ok=True)
+            report = make_report(total)
+            report["metadata"] = {"saved_at": saved.isoformat(), "audit_type": "all"}
+            stamp = saved.strftime("%Y%m%d_%H%M%S")
+            (month_dir / f"audit_all_{stamp}.json").write_text(json.dumps(report))
+
+        trend = manager.get_audit_trend(days=30)
+
+        assert len(trend["data_points"]) == 8
+        assert trend["summary"]["current"] == 8
+        assert trend["summary"]["average"] == 5.0
+        assert trend["summary"]["change_percent"] == -75.0
+
+    def test_compare_reloads_changed_baseline(self, tmp_path):
+        """Comparisons follow edits to the baseline file."""
+        manager = AuditHistoryManager(str(tmp_path))
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps(make_report(2, critical=2)))
+        current = make_report(1, critical=1)
+
+        first = manager.compare_audits(str(baseline), current)
+        assert first["changes"]["status"] == "improved"
+        assert manager.compare_audits(str(baseline), current) == first
+
+        baseline.write_text(json.dumps(make_report(0)))
+        changed = manager.compare_audits(str(baseline), current)
+        assert changed["changes"]["by_severity"]["critical"] == 1
+        assert changed["changes"]["status"] == "degraded"
+
+        with pytest.raises(ValueError):
+            manager.compare_audits(str(tmp_path / "missing.json"), current)
+
+    def test_saved_report_puts_metadata_first(self, tmp_path):
+        """Saved files are valid JSON with fresh metadata ahead of the report."""
+        manager = AuditHistoryManager(str(tmp_path))
+        report = make_report(2)
+        report["metadata"] = {"audit_type": "stale"}
+
+        path = manager.save_audit_report(report, "config")
+        saved = json.loads(Path(path).read_text(encoding="utf-8"))
+
+        assert list(saved)[0] == "metadata"
+        assert saved["metadata"]["audit_type"] == "config"
+        assert saved["audit_info"] == report["audit_info"]
+        assert saved["findings"] == []
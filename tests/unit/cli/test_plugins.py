@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the plugin-based framework audit engine.
+"""
+
+import json
+import sys
+from argparse import Namespace
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from cli.plugins import PluginAuditEngine, handle_framework_audit_command
+from plugins.base import PluginFinding, PluginSeverity
+
+
+def make_finding(control: str, severity: PluginSeverity) -> PluginFinding:
+    """Build a minimal plugin finding."""
+    return PluginFinding(
+        id=f"{control}-1",
+        title=f"{control} finding",
+        description="Test finding",
+        severity=severity,
+        category="test",
+        framework="TEST",
+        control=control,
+        remediation="Fix it",
+    )
+
+
+def make_plugin(name: str, findings: list) -> MagicMock:
+    """Build a fake audit plugin returning the given findings."""
+    plugin = MagicMock()
+    plugin.metadata.name = name
+    plugin.pre_audit_setup.return_value = True
+    plugin.audit.return_value = findings
+    return plugin
+
+
+def make_engine(tmp_path, plugins: dict, controls: dict) -> PluginAuditEngine:
+    """Build an engine whose registry serves the given fake plugins."""
+    engine = PluginAuditEngine(str(tmp_path))
+    registry = MagicMock()
+    registry.registry_data = {
+        "plugins": {
+            name.lower(): {"framework": name, "controls": controls[name]}
+            for name in plugins
+        }
+    }
+    registry.list_plugins.return_value = [
+        {"framework": name, "controls": controls[name]} for name in plugins
+    ]
+    registry.load_plugin.side_effect = lambda framework: plugins[framework]
+    engine.registry = registry
+    return engine
+
+
+@pytest.mark.unit
+@pytest.mark.plugins
+class TestPluginAuditEngine:
+    """Test cases for PluginAuditEngine."""
+
+    def test_control_filter_skips_unrelated_plugins(self, tmp_path, capsys):
+        """Plugins whose registered controls cannot match are never loaded."""
+        plugins = {
+            "ALPHA": make_plugin("Alpha", [make_finding("A-1", PluginSeverity.HIGH)]),
+            "BETA": make_plugin("Beta", [make_finding("B-1", PluginSeverity.HIGH)]),
+        }
+        engine = make_engine(tmp_path, plugins, {"ALPHA": ["A-1"], "BETA": ["B-1"]})
+
+        findings = engine.run_framework_audit(".", controls=["A-1"], config={})
+
+        assert [f.control for f in findings] == ["A-1"]
+        engine.registry.load_plugin.assert_called_once_with("ALPHA")
+
+    def test_repeated_framework_runs_once(self, tmp_path, capsys):
+        """A framework named twice is only loaded and run once."""
+        plugins = {
+            "ALPHA": make_plugin("Alpha", [make_finding("A-1", PluginSeverity.HIGH)])
+        }
+        engine = make_engine(tmp_path, plugins, {"ALPHA": []})
+
+        findings = engine.run_framework_audit(
+            ".", frameworks=["ALPHA", "ALPHA"], config={}
+        )
+
+        assert [f.control for f in findings] == ["A-1"]
+        engine.registry.load_plugin.assert_called_once_with("ALPHA")
+
+    def test_plugins_keep_registry_order(self, tmp_path, capsys):
+        """Concurrent plugins report in registry order; failures are isolated."""
+        broken = make_plugin("Broken", [])
+        broken.audit.side_effect = RuntimeError("boom")
+        plugins = {
+            "ALPHA": make_plugin("Alpha", [make_finding("A-1", PluginSeverity.LOW)]),
+            "BROKEN": broken,
+            "BETA": make_plugin("Beta", [make_finding("B-1", PluginSeverity.HIGH)]),
+        }
+        engine = make_engine(
+            tmp_path, plugins, {"ALPHA": [], "BROKEN": [], "BETA": []}
+        )
+
+        findings = engine.run_framework_audit(".", config={})
+
+        assert [f.control for f in findings] == ["A-1", "B-1"]
+        assert "❌ Plugin Broken failed: boom" in capsys.readouterr().out
+
+    def test_severity_filter(self, tmp_path, capsys):
+        """Findings below the minimum severity are dropped."""
+        findings = [
+            make_finding("A-1", PluginSeverity.INFO),
+            make_finding("A-2", PluginSeverity.MEDIUM),
+            make_finding("A-3", PluginSeverity.CRITICAL),
+        ]
+        plugins = {"ALPHA": make_plugin("Alpha", findings)}
+        engine = make_engine(tmp_path, plugins, {"ALPHA": []})
+
+        kept = engine.run_framework_audit(".", severity_filter="medium", config={})
+
+        assert [f.control for f in kept] == ["A-2", "A-3"]
+
+
+@pytest.mark.unit
+@pytest.mark.plugins
+class TestFrameworkAuditCommand:
+    """Test cases for the framework audit report."""
+
+    def test_json_report_summary(self, tmp_path, capsys):
+        """The saved JSON report counts findings per severity."""
+        findings = [
+            make_finding("A-1", PluginSeverity.HIGH),
+            make_finding("A-2", PluginSeverity.HIGH),
+            make_finding("A-3", PluginSeverity.INFO),
+        ]
+        save_path = tmp_path / "report.json"
+        args = Namespace(
+            framework="ALPHA",
+            control=None,
+            severity=None,
+            output="json",
+            save=str(save_path),
+        )
+
+        with patch.object(
+            PluginAuditEngine, "run_framework_audit", return_value=findings
+        ):
+            handle_framework_audit_command(args)
+
+        report = json.loads(save_path.read_text(encoding="utf-8"))
+        assert report["audit_info"]["total_findings"] == 3
+        assert report["summary"] == {
+            "critical": 0,
+            "high": 2,
+            "medium": 0,
+            "low": 0,
+            "info": 1,
+        }
+        assert [f["control"] for f in report["findings"]] == ["A-1", "A-2", "A-3"]
+        assert report["findings"][0]["severity"] == "high"
+
+    def test_text_report(self, tmp_path, capsys):
+        """The text report lists the summary and each finding."""
+        findings = [
+            make_finding("A-1", PluginSeverity.CRITICAL),
+            make_finding("A-2", PluginSeverity.LOW),
+        ]
+        args = Namespace(
+            framework="ALPHA", control=None, severity=None, output="text", save=None
+        )
+
+        with patch.object(
+            PluginAuditEngine, "run_framework_audit", return_value=findings
+        ):
+            handle_framework_audit_command(args)
+
+        output = capsys.readouterr().out
+        assert "Framework Audit Summary (2 findings)" in output
+        assert "🔴 Critical: 1" in output
+        assert "🔵 Low: 1" in output
+        assert "Medium:" not in output
+        assert "1. 🔴 A-1 finding (CRITICAL)" in output
+        assert "   Framework: TEST | Control: A-2" in output
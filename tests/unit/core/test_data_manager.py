@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the DataManager parsing cache.
+"""
+
+import os
+import pytest
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+from unittest.mock import MagicMock
+
+import core.data_manager as data_manager_module
+from core.data_manager import _MMAP_MIN_SIZE, _ZSTD_MAGIC, DataManager, _parse_file
+
+
+@pytest.fixture
+def data_manager(tmp_path: Path) -> Iterator[DataManager]:
+    """A fresh DataManager over a small source tree."""
+    source = tmp_path / "docs"
+    (source / "nested").mkdir(parents=True)
+    (source / "a.txt").write_text("Access control policy", encoding="utf-8")
+    (source / "nested" / "b.txt").write_text("Audit logging", encoding="utf-8")
+
+    DataManager.reset_singleton()
+    manager = DataManager(
+        {"cache_dir": str(tmp_path / "cache"), "source_dir": str(source)}
+    )
+    yield manager
+    DataManager.reset_singleton()
+
+
+@pytest.mark.unit
+@pytest.mark.core
+class TestDataManager:
+    """Test cases for the DataManager class."""
+
+    def test_hashes_cover_files_only(self, data_manager: DataManager) -> None:
+        """Every regular file gets a signature keyed by its relative path."""
+        hashes = data_manager._calculate_data_hashes()
+
+        assert sorted(hashes) == ["a.txt", str(Path("nested") / "b.txt")]
+
+    def test_unreadable_directory_is_skipped(
+        self, data_manager: DataManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A directory that cannot be listed does not abort the walk."""
+        scandir = os.scandir
+
+        def guarded_scandir(path: str) -> Any:
+            if os.path.basename(path) == "nested":
+                raise PermissionError(13, "Permission denied", path)
+            return scandir(path)
+
+        monkeypatch.setattr(data_manager_module.os, "scandir", guarded_scandir)
+
+        assert sorted(data_manager._calculate_data_hashes()) == ["a.txt"]
+
+    def test_hashes_track_changes(self, data_manager: DataManager) -> None:
+        """Editing a file changes only that file's signature."""
+        before = data_manager._calculate_data_hashes()
+        (data_manager.source_dir / "a.txt").write_text(
+            "Access control policy, revised", encoding="utf-8"
+        )
+
+        after = data_manager._calculate_data_hashes()
+
+        assert after["a.txt"] != before["a.txt"]
+        assert after[str(Path("nested") / "b.txt")] == before[
+            str(Path("nested") / "b.txt")
+        ]
+
+    def test_parsed_data_round_trip(self, data_manager: DataManager) -> None:
+        """Saved parsed data loads back unchanged."""
+        data = {"files": {"a.txt": {"content": "Access control policy"}}}
+
+        data_manager._save_parsed_data(data)
+
+        assert data_manager._load_parsed_data() == data
+
+    def test_large_cache_round_trip(self, data_manager: DataManager) -> None:
+        """A cache above the memory-map threshold loads back unchanged."""
+        data = {"files": {"a.txt": {"content": os.urandom(128 * 1024).hex()}}}
+
+        data_manager._save_parsed_data(data)
+
+        assert data_manager.parsed_data_path.stat().st_size >= _MMAP_MIN_SIZE
+        assert data_manager._load_parsed_data() == data
+
+    def test_compressed_cache_round_trip(self, data_manager: DataManager) -> None:
+        """With zstandard installed the cache is written as a zstd frame."""
+        pytest.importorskip("zstandard")
+        data = {"files": {"a.txt": {"content": "Access control policy " * 100}}}
+
+        data_manager._save_parsed_data(data)
+
+        assert data_manager.parsed_data_path.read_bytes()[:4] == _ZSTD_MAGIC
+        assert data_manager._load_parsed_data() == data
+
+    def test_compressed_cache_without_zstandard(
+        self, data_manager: DataManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A compressed cache is treated as missing when zstandard is absent."""
+        monkeypatch.setattr(data_manager_module, "HAS_ZSTD", False)
+        data_manager.parsed_data_path.write_bytes(_ZSTD_MAGIC + b"\x00" * 16)
+
+        assert data_manager._load_parsed_data() is None
+
+    def test_touched_file_keeps_cache(self, data_manager: DataManager) -> None:
+        """A new mtime alone does not invalidate the cache."""
+        assert not data_manager._data_unchanged()  # nothing stored yet
+        data_manager._save_data_hashes(data_manager._calculate_data_hashes())
+        assert data_manager._data_unchanged()
+
+        os.utime(data_manager.source_dir / "a.txt", ns=(0, 1_000_000_000))
+
+        assert data_manager._data_unchanged()
+        assert data_manager._load_stored_hashes()["a.txt"][1] == 1_000_000_000
+
+    def test_edited_file_invalidates_cache(self, data_manager: DataManager) -> None:
+        """A content change with the same size is still detected."""
+        data_manager._save_data_hashes(data_manager._calculate_data_hashes())
+        path = data_manager.source_dir / "a.txt"
+        path.write_text("Access control POLICY", encoding="utf-8")
+        os.utime(path, ns=(0, 1_000_000_000))
+
+        assert not data_manager._data_unchanged()
+
+    def test_parse_file_entry(self, data_manager: DataManager) -> None:
+        """A parsed file is cached as joined text plus its size."""
+        parser = MagicMock()
+        parser.parse.return_value = ["Access", "", "control"]
+        path = data_manager.source_dir / "a.txt"
+
+        entry = _parse_file(parser, path)
+
+        assert entry["content"] == "Access\n\ncontrol"
+        assert entry["size"] == path.stat().st_size
+
+        parser.parse.side_effect = ValueError("unreadable")
+        assert _parse_file(parser, path) == {"error": "unreadable", "content": None}
+
+    def test_hash_store_applies_changes(self, data_manager: DataManager) -> None:
+        """Stored hashes follow added and removed files."""
+        previous = data_manager._calculate_data_hashes()
+        data_manager._save_data_hashes(previous)
+        (data_manager.source_dir / "a.txt").unlink()
+        (data_manager.source_dir / "c.txt").write_text("Incident", encoding="utf-8")
+
+        assert not data_manager._data_unchanged()
+
+        current = data_manager._calculate_data_hashes(previous)
+        data_manager._save_data_hashes(current, previous)
+        stored = data_manager._load_stored_hashes()
+        assert stored == current
+        assert "a.txt" not in stored and "c.txt" in stored
+
+    def test_count_change_skips_hashing(
+        self, data_manager: DataManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """An added file is detected without stat'ing or hashing any file."""
+        data_manager._save_data_hashes(data_manager._calculate_data_hashes())
+        (data_manager.source_dir / "c.txt").write_text("Incident", encoding="utf-8")
+        file_hash = MagicMock()
+        monkeypatch.setattr(data_manager, "_file_hash", file_hash)
+
+        assert not data_manager._data_unchanged()
+        file_hash.assert_not_called()
+
+    def test_get_data_stores_hashes_after_parse(
+        self, data_manager: DataManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A fresh parse records hashes, so the next check sees no changes."""
+        monkeypatch.setattr(
+            data_manager, "_parse_raw_data", lambda raw_data: {"files": {}}
+        )
+
+        data_manager.get_data()
+
+        assert data_manager._data_unchanged()
+
+    def test_get_data_reparses_changed_files_only(
+        self, data_manager: DataManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """After an edit only added or modified files are parsed again."""
+        parsed: List[List[str]] = []
+
+        def parse_raw_data(raw_data: List[Path]) -> Dict[str, Any]:
+            rel_paths = [
+                str(path.relative_to(data_manager.source_dir)) for path in raw_data
+            ]
+            parsed.append(rel_paths)
+            return {
+                "files": {rel: {"content": rel} for rel in rel_paths},
+                "metadata": {"total_files": len(rel_paths)},
+            }
+
+        monkeypatch.setattr(data_manager, "_parse_raw_data", parse_raw_data)
+        data_manager.get_data()
+        data_manager._parsed_data = None  # drop the in-memory copy
+        source = data_manager.source_dir
+        (source / "a.txt").write_text("Access control, revised", encoding="utf-8")
+        (source / "nested" / "b.txt").unlink()
+        (source / "c.txt").write_text("Incident", encoding="utf-8")
+
+        data = data_manager.get_data()
+
+        assert sorted(parsed[-1]) == ["a.txt", "c.txt"]
+        assert sorted(data["files"]) == ["a.txt", "c.txt"]
+        assert data["metadata"]["total_files"] == 2
+
+    def test_stale_cache_is_fully_reparsed(
+        self, data_manager: DataManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Parsed data not built from the stored hashes is not updated in place."""
+        parsed: List[List[Path]] = []
+
+        def parse_raw_data(raw_data: List[Path]) -> Dict[str, Any]:
+            parsed.append(raw_data)
+            return {
+                "files": {
+                    str(path.relative_to(data_manager.source_dir)): {}
+                    for path in raw_data
+                },
+                "metadata": {"total_files": len(raw_data)},
+            }
+
+        monkeypatch.setattr(data_manager, "_parse_raw_data", parse_raw_data)
+        data_manager.get_data()
+        data_manager._parsed_data = None
+        source = data_manager.source_dir
+        # Stored hashes run ahead of the saved parsed data
+        (source / "a.txt").write_text("Access control, revised", encoding="utf-8")
+        data_manager._save_data_hashes(data_manager._calculate_data_hashes())
+        (source / "nested" / "b.txt").write_text("Audit trail", encoding="utf-8")
+
+        data_manager.get_data()
+
+        assert len(parsed[-1]) == 2
+
+    def test_failed_save_keeps_hashes_stale(
+        self, data_manager: DataManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Hashes are not stored when the parsed data could not be saved."""
+        monkeypatch.setattr(
+            data_manager,
+            "_parse_raw_data",
+            lambda raw_data: {
+                "files": {
+                    str(path.relative_to(data_manager.source_dir)): {
+                        "content": path.read_text(encoding="utf-8")
+                    }
+                    for path in raw_data
+                },
+                "metadata": {"total_files": len(raw_data)},
+            },
+        )
+        data_manager.get_data()
+        data_manager._parsed_data = None
+        (data_manager.source_dir / "a.txt").write_text("Revised", encoding="utf-8")
+
+        with monkeypatch.context() as m:
+            m.setattr(
+                data_manager_module.pickle,
+                "dumps",
+                MagicMock(side_effect=OSError("disk full")),
+            )
+            assert data_manager.get_data()["files"]["a.txt"]["content"] == "Revised"
+        data_manager._parsed_data = None
+
+        assert not data_manager._data_unchanged()
+        assert data_manager.get_data()["files"]["a.txt"]["content"] == "Revised"
+
+    def test_clear_cache_removes_hash_store(self, data_manager: DataManager) -> None:
+        """Invalidating the cache forgets the stored hashes."""
+        data_manager._save_data_hashes(data_manager._calculate_data_hashes())
+
+        data_manager.invalidate_cache()
+
+        assert data_manager._load_stored_hashes() is None
+        assert not data_manager.hash_cache_path.exists()